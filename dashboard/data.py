@@ -0,0 +1,88 @@
+import streamlit as st
+import pandas as pd
+
+
+# Mock 데이터 생성 함수들 (각 페이지가 필요할 때만 호출, 결과는 캐시)
+@st.cache_data
+def get_trade_progress():
+    return {
+        "stages": [
+            {"name": "Q1 Planning", "status": "Completed", "progress": 100},
+            {"name": "Q2 Execution", "status": "Completed", "progress": 100},
+            {"name": "Q3 Analysis", "status": "In Progress", "progress": 67},
+            {"name": "Q4 Forecast", "status": "Waiting", "progress": 0}
+        ],
+        "launch_date": "2026-12-15",
+        "days_remaining": 320
+    }
+
+@st.cache_data
+def get_trade_budget():
+    return {
+        "total": 52000000,
+        "used": 43230000,
+        "remaining": 8770000,
+        "categories": {
+            "Export Operations": 15000000,
+            "Import Management": 18500000,
+            "Logistics": 9730000
+        }
+    }
+
+@st.cache_data
+def get_overdue_shipments():
+    return pd.DataFrame({
+        "Overdue": ["1 Day", "4 Days", "10 Days", "24 Days"],
+        "Shipment": ["Electronics to USA", "Textiles to EU", "Auto Parts to Japan", "Machinery to China"],
+        "Deadline": ["2026-01-28", "2026-01-25", "2026-01-19", "2026-01-05"],
+        "Partner": ["TechCorp", "FashionHub", "AutoLink", "IndustrialCo"]
+    })
+
+@st.cache_data
+def get_trade_volume_by_region():
+    return pd.DataFrame({
+        "Region": ["Asia", "Europe", "Americas", "Middle East", "Africa"],
+        "Volume": [67.5, 65.3, 48.7, 45.2, 30.1]
+    })
+
+@st.cache_data
+def get_upcoming_deadlines():
+    return pd.DataFrame({
+        "Partner": ["TechCorp", "FashionHub", "AutoLink", "IndustrialCo"],
+        "Shipment": ["Consumer Electronics", "Winter Collection", "Engine Components", "Heavy Machinery"],
+        "Deadline": ["2026-02-15", "2026-02-06", "2026-02-01", "2026-02-18"],
+        "Status": ["34%", "56%", "15%", "11%"]
+    })
+
+@st.cache_data
+def get_world_trade_data():
+    """세계 무역 지도용 데이터"""
+    return pd.DataFrame({
+        "Country": ["USA", "China", "Germany", "Japan", "UK", "France", "India", "Italy", "Canada", "South Korea"],
+        "Trade_Volume": [450, 520, 380, 290, 210, 195, 180, 165, 145, 135],
+        "Lat": [37.09, 35.86, 51.16, 36.20, 55.37, 46.22, 20.59, 41.87, 56.13, 37.56],
+        "Lon": [-95.71, 104.19, 10.45, 138.25, -3.43, 2.21, 78.96, 12.56, -106.34, 126.97]
+    })
+
+@st.cache_data
+def get_trade_by_category():
+    """품목별 무역 비중 데이터"""
+    return pd.DataFrame({
+        "Category": ["Electronics", "Machinery", "Automotive", "Textiles", "Chemicals", "Food"],
+        "Value": [23, 19, 15, 12, 18, 13]
+    })
+
+@st.cache_data
+def get_recent_activities():
+    """실시간 활동 로그 데이터"""
+    return pd.DataFrame({
+        "Time": ["2 min ago", "5 min ago", "8 min ago", "12 min ago", "15 min ago"],
+        "Activity": [
+            "🚢 Shipment departed from Shanghai to Los Angeles",
+            "✅ Container cleared customs in Rotterdam",
+            "📦 New order placed: Electronics to Germany",
+            "🚚 Delivery completed in Tokyo",
+            "⚡ Urgent shipment requested: Medical supplies to India"
+        ],
+        "Status": ["In Transit", "Completed", "Processing", "Delivered", "Urgent"]
+    })
@@ -0,0 +1,53 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from dashboard.data import get_world_trade_data
+
+
+@st.cache_resource
+def build_trade_map_figure():
+    trade_data = get_world_trade_data()
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergeo(
+        lon=trade_data['Lon'],
+        lat=trade_data['Lat'],
+        text=trade_data['Country'] + '<br>Trade: $' + trade_data['Trade_Volume'].astype(str) + 'B',
+        mode='markers',
+        marker=dict(
+            size=trade_data['Trade_Volume'] / 10,
+            color=trade_data['Trade_Volume'],
+            colorscale='Viridis',
+            showscale=True,
+            colorbar=dict(title="Trade Volume<br>(Billion USD)"),
+            line=dict(width=1, color='white')
+        )
+    ))
+
+    fig.update_layout(
+        title='Global Trade Volume by Country',
+        geo=dict(
+            projection_type='natural earth',
+            showland=True,
+            landcolor='rgb(243, 243, 243)',
+            coastlinecolor='rgb(204, 204, 204)',
+            showocean=True,
+            oceancolor='rgb(230, 245, 255)',
+        ),
+        height=700
+    )
+    return fig
+
+st.markdown("<h1 class='main-header'>🌍 Global Trade Map</h1>", unsafe_allow_html=True)
+
+trade_data = get_world_trade_data()
+
+# 세계 지도에 무역 데이터 표시
+st.plotly_chart(build_trade_map_figure(), use_container_width=True)
+
+# 하단 통계
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Total Countries", len(trade_data), "+5 YoY")
+col2.metric("Total Trade", f"${trade_data['Trade_Volume'].sum()}B", "+8.2%")
+col3.metric("Avg per Country", f"${trade_data['Trade_Volume'].mean():.1f}B", "+3.1%")
+col4.metric("Top Trader", trade_data.loc[trade_data['Trade_Volume'].idxmax(), 'Country'], "China")
@@ -0,0 +1,165 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from dashboard.data import get_trade_progress, get_trade_budget, get_overdue_shipments, get_trade_volume_by_region, get_upcoming_deadlines
+
+
+@st.cache_resource
+def build_budget_figure():
+    budget_data = get_trade_budget()
+    fig = go.Figure()
+
+    categories = list(budget_data["categories"].keys())
+    values = list(budget_data["categories"].values())
+
+    fig.add_trace(go.Bar(
+        x=categories,
+        y=values,
+        marker_color=['#4CAF50', '#66BB6A', '#A5D6A7'],
+        text=[f"${v/1000000:.1f}M" for v in values],
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        height=300,
+        showlegend=False,
+        yaxis_title="Amount (Million USD)",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+@st.cache_resource
+def build_region_volume_figure():
+    volume_df = get_trade_volume_by_region()
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=volume_df["Region"],
+        y=volume_df["Volume"],
+        marker_color='#4CAF50',
+        text=volume_df["Volume"].apply(lambda x: f"{x}%"),
+        textposition='outside'
+    ))
+
+    fig.update_layout(
+        height=300,
+        showlegend=False,
+        yaxis_title="Volume (%)",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+def color_overdue(val):
+    if "Day" in str(val):
+        days = int(val.split()[0])
+        if days == 1:
+            return 'background-color: #FFF9C4'
+        elif days <= 4:
+            return 'background-color: #FFE082'
+        elif days <= 10:
+            return 'background-color: #FFAB91'
+        else:
+            return 'background-color: #EF9A9A'
+    return ''
+
+# 진행률 바 추가
+def make_progress_bar(val):
+    percent = int(val.replace('%', ''))
+    color = '#4CAF50' if percent > 50 else '#FF9800' if percent > 20 else '#F44336'
+    return f"""
+    <div style='width: 100%; background-color: #e0e0e0; border-radius: 4px;'>
+        <div style='width: {percent}%; background-color: {color}; height: 20px; border-radius: 4px; text-align: center; color: white; font-size: 0.8rem; line-height: 20px;'>
+            {val}
+        </div>
+    </div>
+    """
+
+# 상단 진행 상황
+progress_data = get_trade_progress()
+
+col1, col2, col3, col4, col5 = st.columns([2, 2, 2, 2, 1.5])
+
+stages = progress_data["stages"]
+for idx, col in enumerate([col1, col2, col3, col4]):
+    if idx < len(stages):
+        stage = stages[idx]
+        with col:
+            if stage["status"] == "Completed":
+                st.markdown(f"""
+                <div style='text-align: center;'>
+                    <div class='status-complete'>✓</div>
+                    <p style='margin-top: 10px; font-weight: bold;'>{stage['name']}</p>
+                    <p style='color: #666; font-size: 0.85rem;'>Completed</p>
+                </div>
+                """, unsafe_allow_html=True)
+            elif stage["status"] == "In Progress":
+                st.markdown(f"""
+                <div style='text-align: center;'>
+                    <div class='status-progress'>{stage['progress']}%</div>
+                    <p style='margin-top: 10px; font-weight: bold;'>{stage['name']}</p>
+                    <p style='color: #666; font-size: 0.85rem;'>In Progress</p>
+                </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                <div style='text-align: center;'>
+                    <div class='status-waiting'>⏱</div>
+                    <p style='margin-top: 10px; font-weight: bold;'>{stage['name']}</p>
+                    <p style='color: #666; font-size: 0.85rem;'>Waiting</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+with col5:
+    st.markdown(f"""
+    <div class='deadline-box'>
+        <p style='font-weight: bold; margin: 0;'>Projected Year End</p>
+        <p style='font-size: 1.5rem; margin: 10px 0; font-weight: bold;'>{progress_data['days_remaining']} Days</p>
+        <p style='color: #666; font-size: 0.85rem; margin: 0;'>{progress_data['launch_date']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+st.markdown("---")
+
+# 중간 섹션
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("💰 Trade Budget")
+    budget_data = get_trade_budget()
+
+    # 막대 그래프
+    st.plotly_chart(build_budget_figure(), use_container_width=True)
+
+    col_a, col_b, col_c = st.columns(3)
+    col_a.metric("Total Budget", f"${budget_data['total']/1000000:.0f}M")
+    col_b.metric("Remaining", f"${budget_data['remaining']/1000000:.1f}M")
+    col_c.metric("Currently", "83%", delta="-17% Over Target", delta_color="inverse")
+
+with col2:
+    st.subheader("⚠️ Overdue Shipments")
+    overdue_df = get_overdue_shipments()
+
+    # 스타일링된 테이블
+    styled_df = overdue_df.style.map(color_overdue, subset=['Overdue'])
+    st.dataframe(styled_df, use_container_width=True, height=280)
+
+st.markdown("---")
+
+# 하단 섹션
+col1, col2 = st.columns(2)
+
+with col1:
+    st.subheader("📊 Trade Volume by Region")
+    st.plotly_chart(build_region_volume_figure(), use_container_width=True)
+
+with col2:
+    st.subheader("📅 Upcoming Deadlines")
+    deadlines_df = get_upcoming_deadlines()
+
+    for idx, row in deadlines_df.iterrows():
+        st.markdown(f"**{row['Partner']}** - {row['Shipment']}")
+        st.markdown(f"Deadline: {row['Deadline']}")
+        st.markdown(make_progress_bar(row['Status']), unsafe_allow_html=True)
+        st.markdown("---")
@@ -0,0 +1,76 @@
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from dashboard.data import get_trade_by_category
+
+
+@st.cache_resource
+def build_category_figures():
+    category_data = get_trade_by_category()
+
+    # 방사형 차트 (Polar Chart)
+    polar_fig = go.Figure()
+
+    polar_fig.add_trace(go.Barpolar(
+        r=category_data['Value'],
+        theta=category_data['Category'],
+        marker_color=px.colors.sequential.Viridis,
+        marker_line_color="white",
+        marker_line_width=2,
+        opacity=0.8
+    ))
+
+    polar_fig.update_layout(
+        title="Trade Distribution by Category (Radial View)",
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(category_data['Value']) * 1.2]
+            )
+        ),
+        showlegend=False,
+        height=500
+    )
+
+    # 파이 차트
+    pie_fig = go.Figure()
+
+    pie_fig.add_trace(go.Pie(
+        labels=category_data['Category'],
+        values=category_data['Value'],
+        hole=0.4,
+        marker=dict(colors=px.colors.sequential.Viridis)
+    ))
+
+    pie_fig.update_layout(
+        title="Trade Share by Category",
+        height=500
+    )
+    return polar_fig, pie_fig
+
+st.markdown("<h1 class='main-header'>📈 Trade Analysis by Category</h1>", unsafe_allow_html=True)
+
+category_data = get_trade_by_category()
+polar_fig, pie_fig = build_category_figures()
+
+col1, col2 = st.columns([1, 1])
+
+with col1:
+    st.plotly_chart(polar_fig, use_container_width=True)
+
+with col2:
+    st.plotly_chart(pie_fig, use_container_width=True)
+
+# 하단 테이블
+st.subheader("📊 Detailed Breakdown")
+
+detailed_df = category_data.copy()
+detailed_df['Percentage'] = (detailed_df['Value'] / detailed_df['Value'].sum() * 100).round(1).astype(str) + '%'
+detailed_df['Value (Billion)'] = detailed_df['Value'].apply(lambda x: f"${x}B")
+
+st.dataframe(
+    detailed_df[['Category', 'Value (Billion)', 'Percentage']],
+    use_container_width=True,
+    height=300
+)
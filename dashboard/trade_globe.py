@@ -0,0 +1,56 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from dashboard.data import get_world_trade_data, get_recent_activities
+
+
+@st.cache_resource
+def build_globe_figure():
+    trade_data = get_world_trade_data()
+
+    # 3D 지구본 스타일 맵
+    fig = go.Figure()
+
+    fig.add_trace(go.Scattergeo(
+        lon=trade_data['Lon'],
+        lat=trade_data['Lat'],
+        text=trade_data['Country'],
+        mode='markers+text',
+        marker=dict(
+            size=trade_data['Trade_Volume'] / 8,
+            color=trade_data['Trade_Volume'],
+            colorscale='Plasma',
+            showscale=True,
+            colorbar=dict(title="Trade Volume"),
+            line=dict(width=2, color='white')
+        ),
+        textposition="top center"
+    ))
+
+    fig.update_layout(
+        title='Live Global Trade Activity',
+        geo=dict(
+            projection_type='orthographic',
+            showland=True,
+            landcolor='rgb(243, 243, 243)',
+            countrycolor='rgb(204, 204, 204)',
+            showocean=True,
+            oceancolor='rgb(0, 0, 50)',
+            showcountries=True,
+            bgcolor='rgb(0, 0, 20)'
+        ),
+        height=700,
+        paper_bgcolor='rgb(0, 0, 20)'
+    )
+    return fig
+
+st.markdown("<h1 class='main-header'>🌐 Live Trade Activity Globe</h1>", unsafe_allow_html=True)
+
+st.info("🔄 This view shows real-time trade activities across the globe. Click on markers to see details.")
+
+st.plotly_chart(build_globe_figure(), use_container_width=True)
+
+# 실시간 활동 로그
+st.subheader("📡 Recent Trade Activities")
+
+st.dataframe(get_recent_activities(), use_container_width=True, height=250)
@@ -0,0 +1,56 @@
+"""Streamlit 앱 동시 세션 부하 테스트
+
+    python -m loadtest --app seyeon --concurrency 1 4 16 --iterations 3
+    python -m loadtest --app app --concurrency 1 8 32 --json results.json
+
+동시성 단계마다 새 프로세스를 띄우고, 그 안에서 N개의 가상 세션(AppTest)을 스레드로 동시에 실행합니다.
+세션끼리는 캐시(st.cache_data/resource)와 GIL을 실제 서버 프로세스처럼 공유하고, 단계끼리는 캐시와 메모리를
+공유하지 않으므로 단계별 재실행 지연 p50/p95/p99, 초당 처리 재실행 수, 기준 대비 최대 RSS 증가분으로
+프로세스 하나가 감당하는 세션 수를 가늠할 수 있습니다.
+yfinance와 OpenAI는 loadtest.stubs의 로컬 대체 모듈로 바뀝니다.
+"""
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+from loadtest.flows import FLOWS
+from loadtest.runner import run_level_isolated
+
+def print_report(app, results):
+    print(f"\n[{app}] rerun latency by concurrency")
+    print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'reruns/s':>9} {'base RSS MB':>12} {'+RSS MB':>9}")
+    for r in results:
+        print(f"{r['concurrency']:>8} {r['reruns']:>7} {r['errors']:>6} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['throughput_rps']:>9.2f} {r['baseline_rss_mb']:>12.1f} {r['rss_delta_mb']:>9.1f}")
+    print(f"\n[{app}] rerun latency by step")
+    print(f"{'sessions':>8} {'step':<24} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for r in results:
+        for name, s in r['steps'].items():
+            print(f"{r['concurrency']:>8} {name:<24} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} {s['p99_ms']:>9.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Streamlit 앱 동시 세션 부하 테스트")
+    parser.add_argument("--app", choices=sorted(FLOWS), default="seyeon", help="대상 앱")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="동시 세션 수 단계")
+    parser.add_argument("--iterations", type=int, default=2, help="세션당 시나리오 반복 횟수")
+    parser.add_argument("--timeout", type=float, default=120, help="재실행 1회 제한 시간(초)")
+    parser.add_argument("--yf-latency", type=float, default=0.05, help="yfinance 대체 모듈 응답 지연(초)")
+    parser.add_argument("--openai-latency", type=float, default=0.2, help="OpenAI 대체 모듈 응답 지연(초)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    for concurrency in args.concurrency:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            results.append(pool.submit(run_level_isolated, args.app, concurrency, args.iterations, args.timeout,
+                                       args.yf_latency, args.openai_latency).result())
+        print(f"{args.app}: {concurrency} sessions done in {results[-1]['wall_s']:.1f}s", file=sys.stderr)
+    print_report(args.app, results)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"app": args.app, "results": results}, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if any(r["errors"] for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""앱별 사용자 시나리오
+
+각 시나리오는 AppTest 인스턴스(세션 하나)와 step(name, action) 기록 함수를 받아,
+화면 조작 하나가 일으키는 재실행(rerun)을 step 단위로 측정합니다.
+AppTest는 fragment 안의 위젯 변경도 스크립트 전체 재실행으로 처리하므로 계산기/폼 조작 지연은 상한값입니다.
+"""
+import itertools
+
+APP_PAGES = ["dashboard/global_map.py", "dashboard/trade_analysis.py", "dashboard/trade_globe.py", "dashboard/overview.py"]
+
+def _button(at, text):
+    return next(b for b in at.button if text in b.label)
+
+def _check_downloads(at):
+    names = [b.label for b in at.get("download_button")]
+    if len(names) != 3:
+        raise AssertionError(f"expected 3 document downloads, got {names}")
+
+def seyeon_flow(at, step, iterations):
+    """첫 로드 → 실시간 동기화 → 계산기 조작 → 변동성 분석 윈도우 변경 → 결제조건 변경 후 폼 제출 → 결과 탭 재실행
+    동기화 이후의 재실행은 yfinance(대체 모듈) 이력 조회 경로를 탑니다.
+    results-rerun은 결과 탭(다운로드 버튼 3개)이 그려진 상태의 전체 재실행입니다. AppTest는 HTTP 서버 없이
+    프로세스 전역 가상 런타임에 미디어 파일을 두므로, 다운로드 요청 자체는 측정하지 않습니다."""
+    step("load", at.run)
+    step("sync", lambda: _button(at, "실시간 데이터 동기화").click().run())
+    currencies = itertools.cycle(["EUR", "JPY", "CNY", "USD"])
+    windows = itertools.cycle([60, 120, 20])
+    payments = itertools.cycle(["D/A", "D/P", "Sight L/C"])
+    for i in range(iterations):
+        step("calculator", lambda: at.selectbox(key="side_calc_curr").set_value(next(currencies)).run())
+        step("calculator", lambda: at.number_input(key="side_calc_amt").set_value(1000.0 + 250 * i).run())
+        step("analytics", lambda: at.selectbox(key="fx_vol_window").set_value(next(windows)).run())
+        at.selectbox[[s.label for s in at.selectbox].index("결제방식")].set_value(next(payments))
+        step("submit", lambda: _button(at, "분석 및 서류 생성").click().run())
+        step("results-rerun", lambda: (at.run(), _check_downloads(at)))
+
+def app_flow(at, step, iterations):
+    """첫 로드(Overview) → 메뉴를 차례로 전환"""
+    step("load", at.run)
+    for _ in range(iterations):
+        for page in APP_PAGES:
+            step("page:" + page.split("/")[-1].removesuffix(".py"), lambda: at.switch_page(page).run())
+
+FLOWS = {"seyeon": ("seyeon.py", seyeon_flow), "app": ("app.py", app_flow)}
@@ -0,0 +1,96 @@
+"""동시성 단계 하나의 실행과 측정 (단계마다 새 프로세스에서 불러 쓰도록 __main__과 분리)"""
+import os
+import resource
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from loadtest import stubs
+from loadtest.flows import FLOWS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+def _rss_bytes():
+    """현재 RSS (Linux /proc 기준, 없으면 프로세스 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+class RssSampler(threading.Thread):
+    """측정 구간 동안 RSS를 주기적으로 읽어 최댓값을 기록합니다."""
+
+    def __init__(self, interval=0.05):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.peak = _rss_bytes()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def stop(self):
+        self._stop_event.set(); self.join()
+        return max(self.peak, _rss_bytes())
+
+def run_session(app, iterations, timeout):
+    """가상 세션 하나를 실행하고 [(step, 지연 초, 오류 여부)]를 돌려줍니다."""
+    from streamlit.testing.v1 import AppTest
+    script, flow = FLOWS[app]
+    at = AppTest.from_file(str(ROOT / script), default_timeout=timeout)
+    samples = []
+
+    def step(name, action):
+        start = time.perf_counter()
+        try:
+            action()
+            failed = bool(at.exception)
+        except Exception:
+            traceback.print_exc(limit=1)
+            failed = True
+        samples.append((name, time.perf_counter() - start, failed))
+
+    try:
+        flow(at, step, iterations)
+    except Exception:
+        traceback.print_exc(limit=1)
+        samples.append(("flow", 0.0, True))
+    return samples
+
+def _percentiles(latencies):
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000 if latencies else (float("nan"),) * 3
+    return {"p50_ms": float(p50), "p95_ms": float(p95), "p99_ms": float(p99)}
+
+def run_level(app, concurrency, iterations, timeout):
+    from streamlit.testing.v1 import AppTest  # noqa: F401  (기준 RSS에 streamlit import 비용을 포함)
+    baseline_rss = _rss_bytes()
+    sampler = RssSampler(); sampler.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        sessions = list(pool.map(lambda _: run_session(app, iterations, timeout), range(concurrency)))
+    wall = time.perf_counter() - start
+    peak_rss = sampler.stop()
+
+    samples = [s for session in sessions for s in session]
+    latencies = [elapsed for _, elapsed, _ in samples]
+    by_step = defaultdict(list)
+    for name, elapsed, _ in samples:
+        by_step[name].append(elapsed)
+    return {"concurrency": concurrency, "reruns": len(samples), "errors": sum(failed for *_, failed in samples),
+            "wall_s": wall, "throughput_rps": len(samples) / wall if wall else 0.0, **_percentiles(latencies),
+            "baseline_rss_mb": baseline_rss / 2**20, "peak_rss_mb": peak_rss / 2**20,
+            "rss_delta_mb": (peak_rss - baseline_rss) / 2**20, "steps": {name: _percentiles(values) for name, values in by_step.items()}}
+
+def run_level_isolated(app, concurrency, iterations, timeout, yf_latency, openai_latency):
+    """새 프로세스에서 대체 모듈을 설치하고 한 단계를 실행합니다 (이전 단계의 캐시/메모리 영향 제거)."""
+    os.environ.setdefault("Open_api_key", "load-test")
+    stubs.install(yf_latency, openai_latency)
+    return run_level(app, concurrency, iterations, timeout)
@@ -0,0 +1,50 @@
+"""부하 테스트용 yfinance / OpenAI 대체 모듈
+
+외부 API 대신 지연 시간만 흉내 내는 로컬 모듈을 sys.modules에 넣어, 앱 스크립트의
+`import yfinance as yf`, `from openai import OpenAI`가 이 모듈을 가져가게 합니다.
+"""
+import sys
+import time
+import types
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# 티커별 기준 환율 (다운로드 결과 생성용)
+BASE_RATES = {"KRW=X": 1440.70, "USDKRW=X": 1440.70, "JPYKRW=X": 9.3594, "EURKRW=X": 1717.31, "CNYKRW=X": 207.38}
+
+def make_yfinance(latency=0.05):
+    def download(ticker, period=None, start=None, end=None, interval="1d", progress=False, **kwargs):
+        time.sleep(latency)
+        end = pd.Timestamp(end or pd.Timestamp.today().normalize())
+        days = {"2d": 2, "1mo": 30}.get(period) if period else max((end - pd.Timestamp(start)).days, 2)
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+        base = BASE_RATES.get(ticker, 1000.0)
+        close = base * np.exp(np.cumsum(rng.normal(0, 0.005, days)))
+        return pd.DataFrame({"Close": close}, index=pd.date_range(end=end, periods=days, name="Date"))
+
+    module = types.ModuleType("yfinance")
+    module.download = download
+    return module
+
+def make_openai(latency=0.2):
+    class _Completions:
+        def create(self, model=None, messages=None, **kwargs):
+            time.sleep(latency)
+            content = f"[load-test stub:{model}] " + (messages[-1]["content"] if messages else "")
+            message = types.SimpleNamespace(content=content)
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    class OpenAI:
+        def __init__(self, api_key=None, **kwargs):
+            self.chat = types.SimpleNamespace(completions=_Completions())
+
+    module = types.ModuleType("openai")
+    module.OpenAI = OpenAI
+    return module
+
+def install(yf_latency=0.05, openai_latency=0.2):
+    """대체 모듈을 sys.modules에 등록합니다. 앱 스크립트를 실행하기 전에 호출해야 합니다."""
+    sys.modules["yfinance"] = make_yfinance(yf_latency)
+    sys.modules["openai"] = make_openai(openai_latency)
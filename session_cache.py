@@ -0,0 +1,139 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def estimate_size(value):
+    """캐시 항목이 차지하는 메모리를 바이트 단위로 추정합니다."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(deep=True).sum()) if isinstance(value, pd.DataFrame) else int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class SessionCache:
+    """세션 하나의 대용량 산출물(서류, AI 분석문, 품목 데이터)을 용량 한도 안에서 LRU로 보관합니다."""
+
+    def __init__(self, budget_bytes, registry=None):
+        self.budget_bytes = budget_bytes
+        self._registry = registry
+        self.last_access = time.time()
+        self._items = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = registry._lock if registry is not None else threading.RLock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key, default=None):
+        with self._lock:
+            self.last_access = time.time()
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def put(self, key, value):
+        """항목을 저장하고, 한도를 넘으면 가장 오래 쓰이지 않은 항목부터 내보냅니다. 한도보다 큰 항목은 저장하지 않습니다."""
+        size = estimate_size(value)
+        with self._lock:
+            self.last_access = time.time()
+            self.pop(key)
+            if size > self.budget_bytes:
+                return False
+            self._items[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.budget_bytes:
+                self.evict_lru()
+            if self._registry is not None:
+                self._registry.enforce_total_budget(keep=self)
+            return True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                return default
+            value, size = self._items.pop(key)
+            self._bytes -= size
+            return value
+
+    def evict_lru(self):
+        """가장 오래 쓰이지 않은 항목 하나를 내보내고 그 키를 돌려줍니다."""
+        with self._lock:
+            if not self._items:
+                return None
+            key, (_, size) = self._items.popitem(last=False)
+            self._bytes -= size
+            return key
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    @property
+    def total_bytes(self):
+        return self._bytes
+
+    def report(self):
+        with self._lock:
+            return {"items": {key: size for key, (_, size) in self._items.items()}, "total_bytes": self._bytes,
+                    "budget_bytes": self.budget_bytes, "last_access": self.last_access}
+
+
+class CacheRegistry:
+    """모든 세션의 캐시를 관리합니다. 전체 한도를 넘으면 가장 오래 활동이 없던 세션부터 항목을 내보내고, 유휴 세션은 정리합니다."""
+
+    def __init__(self, session_budget_bytes, total_budget_bytes, idle_ttl=3600):
+        self.session_budget_bytes = session_budget_bytes
+        self.total_budget_bytes = total_budget_bytes
+        self.idle_ttl = idle_ttl
+        self._sessions = {}
+        self._lock = threading.RLock()
+
+    def session(self, session_id):
+        with self._lock:
+            self.drop_idle()
+            if session_id not in self._sessions:
+                self._sessions[session_id] = SessionCache(self.session_budget_bytes, registry=self)
+            cache = self._sessions[session_id]
+            cache.last_access = time.time()
+            return cache
+
+    def enforce_total_budget(self, keep=None):
+        """전체 한도를 넘으면 활동이 오래된 세션부터 항목을 내보냅니다. `keep` 세션은 마지막에 손댑니다."""
+        with self._lock:
+            by_idle = sorted(self._sessions.values(), key=lambda cache: (cache is keep, cache.last_access))
+            for cache in by_idle:
+                while self.total_bytes > self.total_budget_bytes and cache.evict_lru() is not None:
+                    pass
+                if self.total_bytes <= self.total_budget_bytes:
+                    break
+
+    def drop_idle(self):
+        with self._lock:
+            cutoff = time.time() - self.idle_ttl
+            for session_id in [sid for sid, cache in self._sessions.items() if cache.last_access < cutoff]:
+                del self._sessions[session_id]
+
+    @property
+    def total_bytes(self):
+        return sum(cache.total_bytes for cache in self._sessions.values())
+
+    def report(self):
+        """세션별 사용량과 전체 사용량을 돌려줍니다."""
+        with self._lock:
+            sessions = {sid: cache.report() for sid, cache in self._sessions.items()}
+            return {"sessions": sessions, "session_count": len(sessions), "total_bytes": self.total_bytes,
+                    "total_budget_bytes": self.total_budget_bytes}
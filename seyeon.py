@@ -2,21 +2,18 @@ import streamlit as st
 import os
 import pandas as pd
 import matplotlib.pyplot as plt
-import numpy as np
-import yfinance as yf
 import requests
 import time
+from uuid import uuid4
 from datetime import datetime, timedelta
-from io import BytesIO
 from dotenv import load_dotenv
 from openai import OpenAI
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 from bs4 import BeautifulSoup
 import plotly.graph_objects as go
 from rich.console import Console
 from rich.table import Table
+from session_cache import CacheRegistry
+from trade_core import DEFAULT_RATES, DOCX_MIME, HISTORY_TICKERS, build_document_files, build_line_items, build_price_frame, get_rolling_analytics, calculate_estimated_cost, fetch_currency_history, fetch_realtime_rates, landed_cost_risk, settlement_days, to_krw
 
 # --- [1. 환경 변수 및 OpenAI 설정] ---
 load_dotenv()
@@ -104,59 +101,40 @@ st.markdown("""
 
 # --- [4. 세션 상태 초기화] ---
 if 'exchange_rates' not in st.session_state:
-    st.session_state['exchange_rates'] = {"USD": 1440.70, "JPY": 935.94, "EUR": 1717.31, "CNY": 207.38}
+    st.session_state['exchange_rates'] = dict(DEFAULT_RATES)
 if 'use_realtime' not in st.session_state:
     st.session_state['use_realtime'] = False
+if 'session_id' not in st.session_state:
+    st.session_state['session_id'] = uuid4().hex
+
+# 서류 바이트, AI 분석문, 품목 데이터 같은 대용량 산출물은 세션 상태 대신 용량 한도가 있는 캐시에 보관
+@st.cache_resource
+def get_cache_registry():
+    return CacheRegistry(session_budget_bytes=int(os.getenv("SESSION_CACHE_MB", "32")) * 2**20,
+                         total_budget_bytes=int(os.getenv("TOTAL_CACHE_MB", "512")) * 2**20,
+                         idle_ttl=int(os.getenv("SESSION_IDLE_TTL", "3600")))
+
+session_cache = get_cache_registry().session(st.session_state['session_id'])
 
 # --- [5. 환율 관련 함수] ---
 def get_realtime_exchange_rates():
     """yfinance를 사용하여 실시간 환율 정보를 가져옵니다."""
-    tickers = {"USD": "USDKRW=X", "JPY": "JPYKRW=X", "EUR": "EURKRW=X", "CNY": "CNYKRW=X"}
-    updated_rates = {}
     try:
-        for code, ticker in tickers.items():
-            data = yf.download(ticker, period="2d", interval="1d", progress=False)
-            if not data.empty:
-                val = data['Close'].iloc[-1]
-                updated_rates[code] = float(val) * 100 if code == "JPY" else float(val)
-            else:
-                updated_rates[code] = st.session_state['exchange_rates'][code]
-        return updated_rates
+        return fetch_realtime_rates(st.session_state['exchange_rates'])
     except Exception as e:
         st.error(f"데이터를 가져오는 중 오류 발생: {e}")
         return st.session_state['exchange_rates']
 
-@st.cache_data(ttl=3600)
-def get_currency_history(ticker_symbol, base_val, multiplier, use_realtime, current_date):
-    if use_realtime:
-        try:
-            data = yf.download(ticker_symbol, period="1mo", interval="1d", progress=False)
-            if not data.empty and not data['Close'].isnull().all():
-                df = data[['Close']].reset_index()
-                df.columns = ["날짜", "환율"]
-                df['환율'] = df['환율'] * multiplier
-                df['날짜'] = pd.to_datetime(df['날짜']).dt.date
-                return df.sort_values(by="날짜")
-        except Exception: pass
-    
-    np.random.seed(abs(hash(ticker_symbol)) % (10**8))
-    dates = pd.date_range(end=current_date, periods=30)
-    values = base_val + np.cumsum(np.random.randn(30) * (base_val * 0.005))
-    return pd.DataFrame({"날짜": dates.date, "환율": values})
+@st.cache_data(ttl=3600, max_entries=64)
+def get_currency_history(ticker_symbol, base_val, multiplier, use_realtime, current_date, days=30):
+    return fetch_currency_history(ticker_symbol, base_val, multiplier, use_realtime, current_date, days)
 
-def calculate_estimated_cost(base_price, term, transport, insurance, payment, fta_type):
-    total = base_price
-    if term in ["CFR", "CIF", "CPT", "CIP", "DAP", "DPU", "DDP"]:
-        freight_rate = 0.15 if transport == "항공(AIR)" else 0.05
-        total += base_price * freight_rate
-    ins_rates = {"ICC(A) (=ICC(AIR))": 0.008, "ICC(B)": 0.005, "ICC(C)": 0.003, "선택 안함": 0}
-    total += base_price * ins_rates.get(insurance, 0)
-    pay_fees = {"사전 송금": 0.0, "Sight L/C": 0.008, "D/P": 0.0015, "D/A": 0.0025}
-    fee_key = next((k for k in pay_fees if k in payment), "사전 송금")
-    total += base_price * pay_fees.get(fee_key, 0)
-    fta_rates = {"협정 미적용 (기본세율)": 0.18, "한-미 FTA (KOR-USA)": 0.10, "한-EU FTA (KOR-EU)": 0.10, "한-중 FTA (KOR-CHINA)": 0.14, "RCEP": 0.12}
-    if term == "DDP": total += base_price * fta_rates.get(fta_type, 0.18)
-    return total
+ANALYTICS_DAYS = 3 * 365  # 변동성 분석과 Monte Carlo 보정에 쓰는 이력 기간
+
+@st.cache_data(ttl=3600, max_entries=128)
+def get_landed_cost_risk(amount, currency, spot_rate, payment, ticker_symbol, multiplier, use_realtime, current_date):
+    history = get_currency_history(ticker_symbol, spot_rate, multiplier, use_realtime, current_date, ANALYTICS_DAYS)
+    return landed_cost_risk(amount, currency, spot_rate, history['환율'], payment)
 
 # --- [6. Plotly 스타일 차트 함수] ---
 def draw_styled_chart(df, label):
@@ -180,42 +158,145 @@ def draw_styled_chart(df, label):
     )
     return fig
 
-# --- [7. 서류 생성 함수] ---
-def create_ci_docx(data):
-    doc = Document(); doc.add_heading('COMMERCIAL INVOICE', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    table = doc.add_table(rows=6, cols=2); table.style = 'Table Grid'
-    fields = [(f"① Shipper/Seller:\n{data['shipper']}", f"⑦ Invoice No. and date:\n{data['inv_no_date']}"),
-              (f"② Consignee:\n{data['consignee']}", f"⑧ L/C No. and date:\n{data['lc_no_date']}"),
-              (f"⑨ Buyer:\n{data['buyer']}", f"⑪ Terms: {data['terms']} / {data['transport']}"),
-              (f"③ Departure date: {data['dep_date']}", f"⑫ Insurance: {data['insurance']}"),
-              (f"④ Vessel: {data['vessel']} / From: {data['from_port']}", f"⑥ To: {data['to_port']}"),
-              (f"⑬ FTA Agreement: {data['fta']}", f"⑭ Payment: {data['pay']}")]
-    for i, (left, right) in enumerate(fields):
-        table.rows[i].cells[0].text = left; table.rows[i].cells[1].text = right
-    item_table = doc.add_table(rows=2, cols=6); item_table.style = 'Table Grid'
-    for i, txt in enumerate(['Marks', 'Pkgs', 'Description', 'Qty', 'Price', 'Amount']): item_table.rows[0].cells[i].text = txt
-    row = item_table.rows[1].cells
-    row[0].text, row[1].text, row[2].text, row[3].text, row[4].text, row[5].text = data['marks'], data['pkg_kind'], data['description'], str(data['qty']), str(data['unit_price']), str(data['amount'])
-    return doc
+# --- [7. 부분 재실행 구역 (st.fragment)] ---
+# 각 구역은 자기 위젯이 바뀔 때만 다시 실행되고, 나머지 화면은 그대로 유지됩니다.
+# 위젯이 없는 30일 차트(fx_charts)는 전체 재실행 때만 그려지므로 fragment로 감싸지 않습니다.
+@st.fragment
+def side_calculator():
+    st.markdown("### 🧮 실시간 환산")
+    calc_currency = st.selectbox("전환 통화", ["USD", "JPY", "EUR", "CNY"], key="side_calc_curr")
+    input_amt = st.number_input(f"{calc_currency} 금액", value=1000.0, key="side_calc_amt")
+    rate = st.session_state['exchange_rates'][calc_currency]
+    krw_result = to_krw(input_amt, calc_currency, rate)
+    st.divider(); st.success(f"**결과:** {krw_result:,.0f} KRW")
+
+FX_LABELS = {"USD": "USD/KRW", "JPY": "JPY/KRW (100엔)", "EUR": "EUR/KRW", "CNY": "CNY/KRW"}
+
+def fx_currency_list(exchange_rates):
+    return [(label, ticker, exchange_rates[code], mult) for code, label in FX_LABELS.items() for ticker, mult in [HISTORY_TICKERS[code]]]
+
+def fx_charts(exchange_rates, use_realtime, today_date):
+    st.subheader("📈 주요 통화별 최근 30일 추이")
+    g_col1, g_col2 = st.columns(2)
+    for i, (label, ticker, base, mult) in enumerate(fx_currency_list(exchange_rates)):
+        target_col = g_col1 if i % 2 == 0 else g_col2
+        with target_col:
+            df_hist = get_currency_history(ticker, base, mult, use_realtime, today_date)
+            if not df_hist.empty: st.plotly_chart(draw_styled_chart(df_hist, label), use_container_width=True)
+
+@st.fragment
+def fx_analytics(exchange_rates, use_realtime, today_date):
+    st.subheader("📊 환율 리스크 분석 (최근 3년)")
+    currency_list = fx_currency_list(exchange_rates)
+    a1, a2 = st.columns(2)
+    vol_window = a1.selectbox("변동성 윈도우 (거래일)", [20, 60, 120], key="fx_vol_window")
+    focus = a2.selectbox("이동평균 통화", [label for label, *_ in currency_list], key="fx_ma_currency")
+    histories = {label: get_currency_history(ticker, base, mult, use_realtime, today_date, ANALYTICS_DAYS) for label, ticker, base, mult in currency_list}
+    # 캐시 키는 티커 조합 기준. 시뮬레이션 이력은 기준 환율로 모양이 정해지므로 그때만 기준 환율을 키에 포함
+    tickers = tuple((ticker, mult) for _, ticker, _, mult in currency_list)
+    key = (tickers, use_realtime) if use_realtime else (tickers, use_realtime, tuple(base for _, _, base, _ in currency_list))
+    analytics = get_rolling_analytics(key, build_price_frame(histories), vol_window=vol_window, ma_windows=(20, 60, 120), corr_window=60)
+
+    v_col, c_col = st.columns([3, 2])
+    with v_col:
+        fig = go.Figure()
+        for label in analytics.volatility.columns:
+            fig.add_trace(go.Scatter(x=analytics.volatility.index, y=analytics.volatility[label] * 100, mode='lines', name=label))
+        fig.update_layout(title=dict(text=f"<b>연율화 변동성 ({vol_window}일)</b>", font=dict(family='Pretendard', size=18, color='#1e293b')),
+                          template='plotly_white', height=350, margin=dict(l=20, r=20, t=60, b=20), hovermode='x unified', yaxis=dict(ticksuffix='%'))
+        st.plotly_chart(fig, use_container_width=True)
+    with c_col:
+        corr = analytics.correlation
+        fig = go.Figure(go.Heatmap(z=corr.values, x=corr.columns, y=corr.index, zmin=-1, zmax=1, colorscale='RdBu_r', text=corr.round(2).values, texttemplate="%{text}"))
+        fig.update_layout(title=dict(text=f"<b>수익률 상관계수 (최근 {analytics.corr_window}일)</b>", font=dict(family='Pretendard', size=18, color='#1e293b')),
+                          template='plotly_white', height=350, margin=dict(l=20, r=20, t=60, b=20))
+        st.plotly_chart(fig, use_container_width=True)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=analytics.prices.index, y=analytics.prices[focus], mode='lines', name=focus, line=dict(color='#3d5afe', width=2)))
+    for w in analytics.ma_windows:
+        fig.add_trace(go.Scatter(x=analytics.prices.index, y=analytics.moving_averages[w][focus], mode='lines', name=f"MA{w}"))
+    fig.update_layout(title=dict(text=f"<b>{focus} 이동평균</b>", font=dict(family='Pretendard', size=18, color='#1e293b')),
+                      template='plotly_white', height=350, margin=dict(l=20, r=20, t=60, b=20), hovermode='x unified', yaxis=dict(tickformat=',.2f'))
+    st.plotly_chart(fig, use_container_width=True)
 
-def create_pl_docx(data):
-    doc = Document(); doc.add_heading('PACKING LIST', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    table = doc.add_table(rows=4, cols=2); table.style = 'Table Grid'
-    table.rows[0].cells[0].text = f"Seller: {data['shipper']}"; table.rows[0].cells[1].text = f"Inv No: {data['inv_no_date']}"
-    table.rows[1].cells[0].text = f"Consignee: {data['consignee']}"; table.rows[1].cells[1].text = f"Buyer: {data['buyer']}"
-    item_table = doc.add_table(rows=2, cols=6); item_table.style = 'Table Grid'
-    for i, txt in enumerate(['Marks', 'Pkgs', 'Goods', 'N.W', 'G.W', 'Meas']): item_table.rows[0].cells[i].text = txt
-    row = item_table.rows[1].cells
-    for i, key in enumerate(['marks', 'pkg_kind', 'description', 'net_weight', 'gross_weight', 'measure']): row[i].text = str(data[key])
-    return doc
+@st.fragment
+def trade_form(exchange_rates, use_realtime, today_date):
+    st.subheader("📑 거래 상세 및 가격 조건 설정")
+    with st.form("trade_form"):
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.markdown("**1. 기본 거래 정보**")
+            shipper = st.text_area("수출자(Shipper)", "GILDING TRADING CO., LTD.\nSEOUL, KOREA")
+            consignee = st.text_area("수입자(Consignee)", "MONARCH PRO CO., LTD.\nDETROIT, USA")
+            from_port = st.text_input("출발지", "BUSAN, KOREA"); to_port = st.text_input("도착지", "DETROIT, USA")
+            vessel = st.text_input("선박/항공편명", "PHEONIC V.123")
+        with c2:
+            st.markdown("**2. 인코텀즈 및 FTA**")
+            selected_term = st.selectbox("Incoterms 2020", ["EXW", "FOB", "CIF", "DDP", "DAP", "CIP"])
+            selected_fta = st.selectbox("FTA 협정 선택", ["협정 미적용 (기본세율)", "한-미 FTA (KOR-USA)", "한-EU FTA (KOR-EU)", "한-중 FTA (KOR-CHINA)", "RCEP"])
+            transport_mode = st.radio("운송 수단", ["해상(SEA)", "항공(AIR)"], horizontal=True)
+            insurance_type = st.selectbox("적하보험 조건", ["선택 안함", "ICC(A) (=ICC(AIR))", "ICC(B)", "ICC(C)"])
+        with c3:
+            st.markdown("**3. 품목 및 결제 정보**")
+            payment = st.selectbox("결제방식", ["사전 송금 (Advance Payment)", "Sight L/C", "D/P", "D/A"])
+            selected_currency = st.selectbox("거래 통화", ["USD", "JPY", "EUR", "CNY"])
+        st.markdown("**4. 품목 내역**")
+        default_price = 100.0 if selected_currency == "JPY" else 1.0
+        item_rows = st.data_editor(pd.DataFrame({"description": ["NYLON OXFORD"], "qty": [60000], "unit_price": [default_price]}), num_rows="dynamic", use_container_width=True, key="item_editor",
+                                   column_config={"description": st.column_config.TextColumn("품명"), "qty": st.column_config.NumberColumn("수량", min_value=0, step=1),
+                                                  "unit_price": st.column_config.NumberColumn("단가", min_value=0.0, format="%.2f")})
+        st.divider()
+        line_items = build_line_items(item_rows.dropna(how="all").fillna({"description": "", "qty": 0, "unit_price": 0}).to_dict("records"), marks="MON/T DETROIT")
+        subtotal = sum(it['amount'] for it in line_items)
+        estimated_total = calculate_estimated_cost(subtotal, selected_term, transport_mode, insurance_type, payment, selected_fta)
+        final_rate = exchange_rates[selected_currency]
+        total_krw = to_krw(estimated_total, selected_currency, final_rate)
+        st.markdown(f"""<div class="info-box">💡 <b>최신 {selected_currency} 환율 반영 예상 총액:</b> {selected_currency} {estimated_total:,.2f} (약 {total_krw:,.0f} 원)</div>""", unsafe_allow_html=True)
+        if settlement_days(payment) > 0:
+            ticker, mult = HISTORY_TICKERS[selected_currency]
+            risk = get_landed_cost_risk(estimated_total, selected_currency, final_rate, payment, ticker, mult, use_realtime, today_date)
+            st.markdown(f"""<div class="info-box" style="margin-top: 10px;">📉 <b>결제 시점(약 {risk['horizon_days']}일 후) 원화 비용 분포</b> (Monte Carlo {risk['n_paths']:,}회)<br>
+                P5 {risk['p5']:,.0f} 원 · P50 {risk['p50']:,.0f} 원 · P95 {risk['p95']:,.0f} 원 · <b>VaR(95%) {risk['var95']:,.0f} 원</b></div>""", unsafe_allow_html=True)
+        submitted = st.form_submit_button("🚀 분석 및 서류 생성")
 
-def create_bl_docx(data):
-    doc = Document(); doc.add_heading('BILL OF LADING', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
-    table = doc.add_table(rows=3, cols=2); table.style = 'Table Grid'
-    table.rows[0].cells[0].text = f"Shipper: {data['shipper']}"; table.rows[0].cells[1].text = f"B/L No: {data['bl_no']}"
-    table.rows[1].cells[0].text = f"Consignee: {data['consignee']}"; table.rows[1].cells[1].text = f"Vessel: {data['vessel']}"
-    table.rows[2].cells[0].text = f"Loading: {data['from_port']}"; table.rows[2].cells[1].text = f"Discharge: {data['to_port']}"
-    return doc
+    if submitted and not line_items:
+        st.warning("품목을 한 개 이상 입력해 주세요.")
+        submitted = False
+    if submitted:
+        now = datetime(2026, 1, 30); formatted_inv_date = now.strftime('%b. %d. %Y').upper()
+        data = {"shipper": shipper, "consignee": consignee, "from_port": from_port, "to_port": to_port, "vessel": vessel,
+                "inv_no_date": f"INV-{now.year}-{now.strftime('%m%d')}\n{formatted_inv_date}", "lc_no_date": "LC-2026-001", "terms": selected_term, "transport": transport_mode,
+                "insurance": insurance_type, "pay": payment, "fta": selected_fta, "items": line_items, "currency": selected_currency,
+                "amount": f"{estimated_total:,.2f} ({selected_currency})", "pkg_kind": "53 C/NO", "net_weight": "1,200 KGS", "gross_weight": "1,208 KGS", "marks": "MON/T DETROIT", "measure": "5.8 CBM", "bl_no": f"BK-{now.strftime('%y%m%d')}",
+                "dep_date": (now + timedelta(days=7)).strftime('%b. %d. %Y').upper(), "buyer": consignee, "other_ref": "KOREA"}
+        session_cache.pop('doc_files')
+        session_cache.put('current_data', data)
+        with st.spinner("AI 관세사가 FTA 분석 중..."):
+            risk_prompt = f"전문 관세사 분석: 통화 {selected_currency}, FTA {selected_fta}, 인코텀즈 {selected_term}, 결제 {payment}. PSR 충족 가능성과 대금 리스크를 한글로 분석하세요."
+            response = client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": risk_prompt}])
+            session_cache.put('ai_analysis', response.choices[0].message.content)
+
+    # 결과 탭은 폼 구역 안에서 그려 제출해도 차트/분석 구역은 다시 실행되지 않음
+    result_tabs()
+
+def result_tabs():
+    if 'ai_analysis' not in session_cache: return
+    t1, t2 = st.tabs(["💡 AI 전략 가이드", "📥 서류 다운로드"])
+    with t1: st.markdown(session_cache.get('ai_analysis'))
+    with t2:
+        curr = session_cache.get('current_data')
+        doc_files = session_cache.get('doc_files')
+        if doc_files is None and curr is not None:
+            doc_files = build_document_files(curr)
+            session_cache.put('doc_files', doc_files)
+        if doc_files is None:
+            st.warning("메모리 한도로 거래 데이터가 정리되었습니다. 서류를 다시 생성해 주세요.")
+        else:
+            cols = st.columns(3)
+            for i, (name, payload) in enumerate(doc_files.items()):
+                cols[i].download_button(label=f"📥 {name}", data=payload, file_name=name, mime=DOCX_MIME, on_click="ignore")
+            st.success("모든 서류 생성이 완료되었습니다.")
 
 # --- [8. 사이드바 구성] ---
 with st.sidebar:
@@ -225,12 +306,7 @@ with st.sidebar:
     st.markdown("---")
     st.subheader("🧮 환율 도구")
     with st.popover("🔍 간이 계산기 열기", use_container_width=True):
-        st.markdown("### 🧮 실시간 환산")
-        calc_currency = st.selectbox("전환 통화", ["USD", "JPY", "EUR", "CNY"], key="side_calc_curr")
-        input_amt = st.number_input(f"{calc_currency} 금액", value=1000.0, key="side_calc_amt")
-        rate = current_rates[calc_currency]
-        krw_result = input_amt * (rate / 100) if calc_currency == "JPY" else input_amt * rate
-        st.divider(); st.success(f"**결과:** {krw_result:,.0f} KRW")
+        side_calculator()
     st.markdown("---")
     st.subheader("⚙️ 데이터 제어")
     if st.button("🔄 실시간 데이터 동기화"):
@@ -241,6 +317,10 @@ with st.sidebar:
             st.success("API 동기화 완료")
             time.sleep(0.5); st.rerun()
     st.info("💡 동기화 시 yfinance API를 연동합니다.")
+    with st.expander("🧠 메모리 사용량"):
+        registry_report = get_cache_registry().report()
+        st.caption(f"이 세션: {session_cache.total_bytes / 2**20:,.2f} MB / {session_cache.budget_bytes / 2**20:,.0f} MB")
+        st.caption(f"전체 {registry_report['session_count']}개 세션: {registry_report['total_bytes'] / 2**20:,.2f} MB / {registry_report['total_budget_bytes'] / 2**20:,.0f} MB")
 
 # --- [9. 메인 화면 로직] ---
 st.title("🚢 Trade Master 2026: FTA & 결제 통합 자동화")
@@ -297,70 +377,8 @@ rates_html = f"""
 st.markdown(rates_html, unsafe_allow_html=True)
 
 # --- [Plotly 차트 섹션] ---
-st.subheader("📈 주요 통화별 최근 30일 추이")
-g_col1, g_col2 = st.columns(2)
-currency_list = [("USD/KRW", "KRW=X", exchange_rates['USD'], 1), ("JPY/KRW (100엔)", "JPYKRW=X", exchange_rates['JPY'], 100),
-                 ("EUR/KRW", "EURKRW=X", exchange_rates['EUR'], 1), ("CNY/KRW", "CNYKRW=X", exchange_rates['CNY'], 1)]
-
-for i, (label, ticker, base, mult) in enumerate(currency_list):
-    target_col = g_col1 if i % 2 == 0 else g_col2
-    with target_col:
-        df_hist = get_currency_history(ticker, base, mult, use_realtime, today_date)
-        if not df_hist.empty: st.plotly_chart(draw_styled_chart(df_hist, label), use_container_width=True)
+fx_charts(exchange_rates, use_realtime, today_date)
+fx_analytics(exchange_rates, use_realtime, today_date)
 
 st.divider()
-st.subheader("📑 거래 상세 및 가격 조건 설정")
-with st.form("trade_form"):
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        st.markdown("**1. 기본 거래 정보**")
-        shipper = st.text_area("수출자(Shipper)", "GILDING TRADING CO., LTD.\nSEOUL, KOREA")
-        consignee = st.text_area("수입자(Consignee)", "MONARCH PRO CO., LTD.\nDETROIT, USA")
-        from_port = st.text_input("출발지", "BUSAN, KOREA"); to_port = st.text_input("도착지", "DETROIT, USA")
-        vessel = st.text_input("선박/항공편명", "PHEONIC V.123")
-    with c2:
-        st.markdown("**2. 인코텀즈 및 FTA**")
-        selected_term = st.selectbox("Incoterms 2020", ["EXW", "FOB", "CIF", "DDP", "DAP", "CIP"])
-        selected_fta = st.selectbox("FTA 협정 선택", ["협정 미적용 (기본세율)", "한-미 FTA (KOR-USA)", "한-EU FTA (KOR-EU)", "한-중 FTA (KOR-CHINA)", "RCEP"])
-        transport_mode = st.radio("운송 수단", ["해상(SEA)", "항공(AIR)"], horizontal=True)
-        insurance_type = st.selectbox("적하보험 조건", ["선택 안함", "ICC(A) (=ICC(AIR))", "ICC(B)", "ICC(C)"])
-    with c3:
-        st.markdown("**3. 품목 및 결제 정보**")
-        payment = st.selectbox("결제방식", ["사전 송금 (Advance Payment)", "Sight L/C", "D/P", "D/A"])
-        description = st.text_input("품명", "NYLON OXFORD")
-        qty_input = st.number_input("수량", value=60000)
-        selected_currency = st.selectbox("거래 통화", ["USD", "JPY", "EUR", "CNY"])
-        unit_price_input = st.number_input(f"단가({selected_currency})", value=1.0 if selected_currency != "JPY" else 100.0)
-    st.divider()
-    subtotal = qty_input * unit_price_input
-    estimated_total = calculate_estimated_cost(subtotal, selected_term, transport_mode, insurance_type, payment, selected_fta)
-    final_rate = exchange_rates[selected_currency]
-    total_krw = estimated_total * (final_rate / 100) if selected_currency == "JPY" else estimated_total * final_rate
-    st.markdown(f"""<div class="info-box">💡 <b>최신 {selected_currency} 환율 반영 예상 총액:</b> {selected_currency} {estimated_total:,.2f} (약 {total_krw:,.0f} 원)</div>""", unsafe_allow_html=True)
-    submitted = st.form_submit_button("🚀 분석 및 서류 생성")
-
-if submitted:
-    now = datetime(2026, 1, 30); formatted_inv_date = now.strftime('%b. %d. %Y').upper()
-    data = {"shipper": shipper, "consignee": consignee, "from_port": from_port, "to_port": to_port, "vessel": vessel,
-            "inv_no_date": f"INV-{now.year}-{now.strftime('%m%d')}\n{formatted_inv_date}", "lc_no_date": "LC-2026-001", "terms": selected_term, "transport": transport_mode,
-            "insurance": insurance_type, "pay": payment, "fta": selected_fta, "description": description, "qty": f"{qty_input:,}", "unit_price": f"{unit_price_input:.2f}", 
-            "amount": f"{estimated_total:,.2f} ({selected_currency})", "pkg_kind": "53 C/NO", "net_weight": "1,200 KGS", "gross_weight": "1,208 KGS", "marks": "MON/T DETROIT", "measure": "5.8 CBM", "bl_no": f"BK-{now.strftime('%y%m%d')}",
-            "dep_date": (now + timedelta(days=7)).strftime('%b. %d. %Y').upper(), "buyer": consignee, "other_ref": "KOREA"}
-    st.session_state['current_data'] = data
-    with st.spinner("AI 관세사가 FTA 분석 중..."):
-        risk_prompt = f"전문 관세사 분석: 통화 {selected_currency}, FTA {selected_fta}, 인코텀즈 {selected_term}, 결제 {payment}. PSR 충족 가능성과 대금 리스크를 한글로 분석하세요."
-        response = client.chat.completions.create(model="gpt-4o", messages=[{"role": "user", "content": risk_prompt}])
-        st.session_state['ai_analysis'] = response.choices[0].message.content
-
-if 'ai_analysis' in st.session_state:
-    t1, t2 = st.tabs(["💡 AI 전략 가이드", "📥 서류 다운로드"])
-    with t1: st.markdown(st.session_state['ai_analysis'])
-    with t2:
-        curr = st.session_state['current_data']
-        doc_files = {"Commercial_Invoice.docx": create_ci_docx(curr), "Packing_List.docx": create_pl_docx(curr), "Bill_of_Lading.docx": create_bl_docx(curr)}
-        cols = st.columns(3)
-        for i, (name, doc) in enumerate(doc_files.items()):
-            bio = BytesIO(); doc.save(bio)
-            cols[i].download_button(label=f"📥 {name}", data=bio.getvalue(), file_name=name, mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-        st.success("모든 서류 생성이 완료되었습니다.")
-
+trade_form(exchange_rates, use_realtime, today_date)
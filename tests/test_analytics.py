@@ -0,0 +1,61 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from trade_core.analytics import RollingFXAnalytics, build_price_frame
+from trade_core.fx import DEFAULT_RATES, HISTORY_TICKERS, fetch_currency_history
+
+
+def _prices(days, seed=0, end="2026-10-19"):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=end, periods=days)
+    return pd.DataFrame({"USD": 1440 * np.exp(np.cumsum(rng.normal(0, 0.005, days))),
+                         "EUR": 1717 * np.exp(np.cumsum(rng.normal(0, 0.005, days)))}, index=index)
+
+
+def _assert_same(a, b):
+    np.testing.assert_allclose(a.prices.to_numpy(), b.prices.to_numpy())
+    np.testing.assert_allclose(a.volatility.to_numpy(), b.volatility.to_numpy(), equal_nan=True)
+    for w in a.ma_windows:
+        np.testing.assert_allclose(a.moving_averages[w].to_numpy(), b.moving_averages[w].to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(a.correlation.to_numpy(), b.correlation.to_numpy())
+
+
+def test_update_appends_only_new_days():
+    prices = _prices(400)
+    analytics = RollingFXAnalytics(prices.iloc[:-5])
+    assert analytics.update(prices) == 5
+    assert analytics.update(prices) == 0
+    _assert_same(analytics, RollingFXAnalytics(prices))
+
+
+def test_update_rebuilds_when_overlap_changes():
+    analytics = RollingFXAnalytics(_prices(400, seed=0, end="2026-10-18"))
+    regenerated = _prices(400, seed=1, end="2026-10-19")
+    assert analytics.update(regenerated) == len(regenerated)
+    _assert_same(analytics, RollingFXAnalytics(regenerated))
+
+
+def test_update_rebuilds_when_last_bar_is_revised():
+    prices = _prices(400)
+    analytics = RollingFXAnalytics(prices.iloc[:-1])
+    revised = prices.copy()
+    revised.iloc[-2, 0] += 1.0
+    analytics.update(revised)
+    _assert_same(analytics, RollingFXAnalytics(revised))
+
+
+def test_next_day_of_simulated_history_recomputes_only_recent_rows():
+    def frame(day):
+        return build_price_frame({code: fetch_currency_history(ticker, DEFAULT_RATES[code], mult, False, day, 3 * 365)
+                                  for code, (ticker, mult) in HISTORY_TICKERS.items()})
+
+    analytics = RollingFXAnalytics(frame(date(2026, 10, 18)), ma_windows=(20, 60, 120))
+    today = frame(date(2026, 10, 19))
+    assert analytics.update(today) < 20
+    np.testing.assert_allclose(analytics.prices.iloc[-1].to_numpy(), [DEFAULT_RATES[code] for code in HISTORY_TICKERS])
+    expected = RollingFXAnalytics(today, ma_windows=(20, 60, 120))
+    warm = today.index[120:]  # 처음부터 계산한 쪽의 윈도우 준비 구간(NaN)은 제외
+    np.testing.assert_allclose(analytics.volatility.loc[warm].to_numpy(), expected.volatility.loc[warm].to_numpy())
+    np.testing.assert_allclose(analytics.moving_averages[120].loc[warm].to_numpy(), expected.moving_averages[120].loc[warm].to_numpy())
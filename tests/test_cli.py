@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from trade_core.cli import main
+
+
+def test_quote_reports_bad_lines_and_continues(tmp_path, capsys):
+    src = tmp_path / "quotes.jsonl"
+    out = tmp_path / "results.jsonl"
+    src.write_text("\n".join([
+        json.dumps({"base_price": 100, "currency": "USD", "terms": "FOB"}),
+        "not json",
+        json.dumps({"base_price": 100, "currency": "GBP"}),
+        json.dumps({"base_price": 200, "currency": "EUR"}),
+    ]) + "\n", encoding="utf-8")
+
+    assert main(["quote", str(src), "-o", str(out)]) == 1
+
+    results = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r.get("line") for r in results] == [None, 2, 3, None]
+    assert "GBP" in results[2]["error"]
+    assert results[3]["estimated_total"] == 200
+    assert "line 2:" in capsys.readouterr().err
+
+
+def test_docs_rejects_doc_id_outside_output_dir(tmp_path, capsys):
+    src = tmp_path / "shipments.jsonl"
+    out = tmp_path / "out"
+    record = {"shipper": "S", "consignee": "C", "buyer": "C", "inv_no_date": "INV-1", "lc_no_date": "LC-1", "terms": "FOB",
+              "transport": "해상(SEA)", "insurance": "선택 안함", "dep_date": "FEB. 06. 2026", "vessel": "V", "from_port": "BUSAN",
+              "to_port": "LA", "fta": "RCEP", "pay": "D/A", "bl_no": "BL-1", "items": [{"description": "A", "qty": 1, "unit_price": 2}]}
+    src.write_text("\n".join(json.dumps({**record, "doc_id": doc_id}) for doc_id in ["../../escape", "ok-1"]) + "\n", encoding="utf-8")
+
+    assert main(["docs", str(src), "-o", str(out), "--workers", "1"]) == 1
+
+    assert "line 1:" in capsys.readouterr().err
+    assert sorted(p.name for p in out.iterdir()) == ["ok-1_Bill_of_Lading.docx", "ok-1_Commercial_Invoice.docx", "ok-1_Packing_List.docx"]
+    assert not list(tmp_path.glob("*.docx"))
+
+
+def test_quote_worker_import_skips_pandas_and_docx():
+    code = "import sys, trade_core.cli; print(any(m in sys.modules for m in ('pandas', 'docx', 'trade_core.analytics')))"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                          cwd=Path(__file__).resolve().parent.parent).stdout.strip() == "False"
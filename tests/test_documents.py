@@ -0,0 +1,51 @@
+from io import BytesIO
+
+from docx import Document
+
+from trade_core.documents import ROW_CHUNK, build_document_files, build_line_items
+
+BASE = {"shipper": "GILDING TRADING CO., LTD.\nSEOUL, KOREA", "consignee": "MONARCH PRO CO., LTD.", "buyer": "MONARCH PRO CO., LTD.",
+        "inv_no_date": "INV-2026-0130", "lc_no_date": "LC-2026-001", "terms": "CIF", "transport": "해상(SEA)", "insurance": "ICC(B)",
+        "dep_date": "FEB. 06. 2026", "vessel": "PHEONIC V.123", "from_port": "BUSAN", "to_port": "DETROIT", "fta": "RCEP", "pay": "D/A",
+        "bl_no": "BK-260130", "currency": "USD", "amount": "1,234.50 (USD)", "marks": "MON/T DETROIT", "pkg_kind": "53 C/NO",
+        "net_weight": "1,200 KGS", "gross_weight": "1,208 KGS", "measure": "5.8 CBM"}
+
+
+def _item_rows(name, data):
+    doc = Document(BytesIO(build_document_files(data)[name]))
+    return [[cell.text for cell in row.cells] for row in doc.tables[-1].rows]
+
+
+def test_ci_rows_escape_text_and_keep_line_breaks():
+    items = build_line_items([{"description": "BOLTS <M8> & NUTS\nZINC PLATED", "qty": 2.5, "unit_price": 4},
+                              {"description": "NYLON OXFORD", "qty": 1000, "unit_price": 1.25}], marks=BASE["marks"])
+    rows = _item_rows("Commercial_Invoice.docx", {**BASE, "items": items})
+    assert rows[0] == ['Marks', 'Pkgs', 'Description', 'Qty', 'Price', 'Amount']
+    assert rows[1] == ["MON/T DETROIT", "", "BOLTS <M8> & NUTS\nZINC PLATED", "2.50", "4.00", "10.00"]
+    assert rows[2] == ["MON/T DETROIT", "", "NYLON OXFORD", "1,000", "1.25", "1,250.00"]
+    assert rows[3] == ["", "53 C/NO", "TOTAL", "1,002.50", "", "1,260.00 (USD)"]
+    assert rows[4] == ["", "", "Estimated total (CIF)", "", "", "1,234.50 (USD)"]
+
+
+def test_pl_has_total_row():
+    items = build_line_items([{"description": "A", "qty": 1, "unit_price": 1}], marks=BASE["marks"])
+    rows = _item_rows("Packing_List.docx", {**BASE, "items": items})
+    assert rows[-1] == ["", "53 C/NO", "TOTAL", "1,200 KGS", "1,208 KGS", "5.8 CBM"]
+
+
+def test_row_count_across_chunks():
+    items = build_line_items([{"description": f"ITEM {i}", "qty": 1, "unit_price": 1} for i in range(2 * ROW_CHUNK + 1)])
+    rows = _item_rows("Commercial_Invoice.docx", {**BASE, "items": items})
+    assert len(rows) == 1 + len(items) + 2
+    assert [r[2] for r in rows[1:-2]] == [f"ITEM {i}" for i in range(len(items))]
+
+
+def test_legacy_single_item_has_no_total_rows():
+    legacy = {**BASE, "description": "NYLON OXFORD", "qty": 60000, "unit_price": 1.0, "amount": 60000.0}
+    rows = _item_rows("Commercial_Invoice.docx", legacy)
+    assert rows[1:] == [["MON/T DETROIT", "53 C/NO", "NYLON OXFORD", "60,000", "1.00", "60,000.00"]]
+
+
+def test_empty_item_list_does_not_fall_back_to_legacy_row():
+    rows = _item_rows("Commercial_Invoice.docx", {**BASE, "items": []})
+    assert [r[2] for r in rows[1:]] == ["TOTAL", "Estimated total (CIF)"]
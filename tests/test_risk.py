@@ -0,0 +1,61 @@
+from datetime import date
+
+import numpy as np
+
+from trade_core.fx import fetch_currency_history
+from trade_core.risk import calibrate_gbm, landed_cost_risk, simulate_fx_paths
+
+
+def test_simulated_history_is_deterministic_and_leaves_global_rng_alone():
+    np.random.seed(123)
+    expected = np.random.random()
+    np.random.seed(123)
+    first = fetch_currency_history("KRW=X", 1400.0, 1, False, date(2024, 1, 31))
+    second = fetch_currency_history("KRW=X", 1400.0, 1, False, date(2024, 1, 31))
+    assert np.array_equal(first["환율"].to_numpy(), second["환율"].to_numpy())
+    assert np.random.random() == expected
+
+
+def test_zero_volatility_paths_follow_log_return_drift():
+    rates = 100.0 * np.exp(0.001 * np.arange(30))
+    mu, sigma = calibrate_gbm(rates)
+    paths = simulate_fx_paths(100.0, mu, 0.0, horizon_days=10, n_paths=4, seed=0)
+    np.testing.assert_allclose(paths[:, -1], 100.0 * np.exp(10 * mu), rtol=1e-5)
+    assert abs(mu - 0.001) < 1e-12 and sigma < 1e-9
+
+
+def _trending_history(daily_drift=0.002, days=400):
+    noise = np.random.default_rng(1).normal(0, 0.005, days)
+    return 1000.0 * np.exp(np.cumsum(noise + daily_drift))
+
+
+def test_landed_cost_risk_summary_is_ordered_and_centred_on_spot():
+    risk = landed_cost_risk(10_000, "USD", 1400.0, _trending_history(), "D/A", n_paths=20_000)
+    assert risk["horizon_days"] == 60 and risk["n_paths"] == 20_000
+    assert risk["spot_krw"] == 10_000 * 1400.0
+    assert risk["p5"] <= risk["p50"] <= risk["p95"]
+    assert risk["var95"] == risk["p95"] - risk["spot_krw"]
+    # drift 0이 기본값이라 이력의 상승 추세와 관계없이 중앙값이 현재 환율 기준 비용 근처에 있음
+    assert abs(risk["p50"] / risk["spot_krw"] - 1) < 0.005
+
+
+def test_landed_cost_risk_historical_drift_is_opt_in():
+    history = _trending_history()
+    base = landed_cost_risk(10_000, "USD", 1400.0, history, "D/A", n_paths=20_000)
+    drifted = landed_cost_risk(10_000, "USD", 1400.0, history, "D/A", n_paths=20_000, historical_drift=True)
+    assert drifted["p50"] > base["p50"] * 1.05
+
+
+def test_landed_cost_risk_advance_payment_has_no_horizon():
+    risk = landed_cost_risk(10_000, "USD", 1400.0, _trending_history(), "사전 송금 (T/T in advance)")
+    assert risk == {"horizon_days": 0, "n_paths": 0, "spot_krw": 14_000_000.0, "mean": 14_000_000.0,
+                    "p5": 14_000_000.0, "p50": 14_000_000.0, "p95": 14_000_000.0, "var95": 0.0}
+
+
+def test_landed_cost_risk_scales_jpy_per_100_yen():
+    history = _trending_history(daily_drift=0.0)
+    jpy = landed_cost_risk(100_000, "JPY", 935.94, history, "D/P", n_paths=5_000)
+    usd = landed_cost_risk(100_000, "USD", 935.94, history, "D/P", n_paths=5_000)
+    assert np.isclose(jpy["spot_krw"], 935_940.0)
+    for key in ("mean", "p5", "p50", "p95", "var95"):
+        assert np.isclose(jpy[key] * 100, usd[key])
@@ -0,0 +1,68 @@
+import time
+
+from session_cache import CacheRegistry, SessionCache
+
+
+def test_item_larger_than_budget_is_rejected():
+    cache = SessionCache(budget_bytes=100)
+    assert cache.put("small", b"x" * 40)
+    assert not cache.put("big", b"x" * 101)
+    assert "big" not in cache
+    assert cache.get("small") == b"x" * 40
+    assert cache.total_bytes == 40
+
+
+def test_least_recently_used_item_is_evicted_first():
+    cache = SessionCache(budget_bytes=100)
+    cache.put("a", b"x" * 40)
+    cache.put("b", b"x" * 40)
+    cache.get("a")  # a가 가장 최근에 사용됨
+    cache.put("c", b"x" * 40)
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.total_bytes == 80
+
+
+def test_replacing_key_updates_size():
+    cache = SessionCache(budget_bytes=100)
+    cache.put("a", b"x" * 60)
+    cache.put("a", b"x" * 10)
+    assert cache.total_bytes == 10
+
+
+def test_total_budget_evicts_idle_sessions_and_spares_keep():
+    registry = CacheRegistry(session_budget_bytes=100, total_budget_bytes=120)
+    idle = registry.session("idle")
+    idle.put("old", b"x" * 60)
+    idle.last_access = time.time() - 100
+    active = registry.session("active")
+    assert active.put("new", b"x" * 80)
+    assert "new" in active
+    assert "old" not in idle
+    assert registry.total_bytes == 80
+
+
+def test_total_budget_evicts_keep_session_only_as_last_resort():
+    registry = CacheRegistry(session_budget_bytes=100, total_budget_bytes=80)
+    other = registry.session("other")
+    other.put("o", b"x" * 30)
+    other.last_access = time.time() - 100
+    keep = registry.session("keep")
+    keep.put("k1", b"x" * 40)
+    keep.put("k2", b"x" * 40)
+    assert "o" not in other
+    assert "k1" in keep and "k2" in keep
+    keep.put("k3", b"x" * 10)
+    assert "k1" not in keep and "k2" in keep and "k3" in keep
+    assert registry.total_bytes == 50
+
+
+def test_drop_idle_removes_expired_sessions():
+    registry = CacheRegistry(session_budget_bytes=100, total_budget_bytes=1000, idle_ttl=60)
+    registry.session("stale").put("a", b"x" * 10)
+    registry.session("stale").last_access = time.time() - 120
+    registry.session("fresh").put("b", b"x" * 10)
+    registry.drop_idle()
+    report = registry.report()
+    assert set(report["sessions"]) == {"fresh"}
+    assert report["total_bytes"] == 10
@@ -0,0 +1,26 @@
+"""Streamlit 없이 쓸 수 있는 가격 계산, 환율, 서류 생성 로직 (import 시 부수 효과 없음)
+
+하위 모듈은 처음 쓰일 때 불러옵니다. 견적만 계산하는 CLI 워커는 python-docx나 분석 모듈을 불러오지 않습니다.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "trade_core.pricing": ["build_line_items", "calculate_estimated_cost", "to_krw"],
+    "trade_core.fx": ["DEFAULT_RATES", "HISTORY_TICKERS", "fetch_realtime_rates", "fetch_currency_history"],
+    "trade_core.analytics": ["RollingFXAnalytics", "build_price_frame", "correlation_matrix", "get_rolling_analytics", "moving_averages", "rolling_volatility"],
+    "trade_core.risk": ["SETTLEMENT_DAYS", "calibrate_gbm", "landed_cost_risk", "settlement_days", "simulate_fx_paths"],
+    "trade_core.documents": ["DOCX_MIME", "build_document_files", "create_ci_docx", "create_pl_docx", "create_bl_docx"],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+def __getattr__(name):
+    if name not in _MODULE_OF:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_MODULE_OF[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,5 @@
+import sys
+
+from trade_core.cli import main
+
+sys.exit(main())
@@ -0,0 +1,120 @@
+"""환율 이력 기반 롤링 분석: 변동성, 이동평균, 통화 간 상관관계
+
+pandas의 rolling 커널로 전체 이력을 한 번에 계산하고, 이후 새 날짜가 들어오거나 최근 값이 바뀌면
+(장중 마지막 봉이 종가로 확정되는 경우 등) 처음 달라진 날짜부터의 행만 가장 긴 윈도우 길이만큼의
+앞 구간과 함께 다시 계산해 결과를 교체합니다.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+def build_price_frame(histories):
+    """{통화 라벨: 날짜/환율 DataFrame}을 날짜 인덱스, 통화별 열을 가진 가격 표로 합칩니다."""
+    frames = {label: df.set_index(pd.to_datetime(df['날짜']))['환율'] for label, df in histories.items()}
+    return pd.DataFrame(frames).sort_index().ffill().dropna()
+
+def log_returns(prices):
+    return np.log(prices).diff()
+
+def rolling_volatility(prices, window):
+    """연율화된 롤링 변동성 (일간 로그수익률 표준편차 x sqrt(252))"""
+    return log_returns(prices).rolling(window).std() * np.sqrt(TRADING_DAYS)
+
+def moving_averages(prices, windows):
+    return {w: prices.rolling(w).mean() for w in windows}
+
+def correlation_matrix(prices, window=None):
+    """최근 window일 로그수익률의 통화 간 상관계수 행렬 (window가 없으면 전체 기간)"""
+    returns = log_returns(prices).dropna()
+    return (returns.iloc[-window:] if window else returns).corr()
+
+
+class RollingFXAnalytics:
+    """가격 표 하나에 대한 롤링 지표를 보관하고, 새 날짜가 추가될 때 그 날짜들만 계산해 이어 붙입니다."""
+
+    def __init__(self, prices, vol_window=20, ma_windows=(20, 60), corr_window=60):
+        self.vol_window = vol_window
+        self.ma_windows = tuple(ma_windows)
+        self.corr_window = corr_window
+        self._lookback = max(vol_window, *self.ma_windows)
+        self._lock = threading.Lock()
+        self._rebuild(prices)
+
+    def _rebuild(self, prices):
+        self.prices = prices.sort_index()
+        self.returns, self.volatility, self.moving_averages = self._compute(self.prices)
+        self._correlation = None
+
+    def _compute(self, prices):
+        returns = log_returns(prices)
+        volatility = returns.rolling(self.vol_window).std() * np.sqrt(TRADING_DAYS)
+        return returns, volatility, moving_averages(prices, self.ma_windows)
+
+    def _first_changed(self, prices):
+        """기존 가격 표와 prices의 겹치는 구간에서 값이 다르거나 한쪽에만 있는 첫 날짜 (모두 같으면 None)"""
+        old = self.prices[self.prices.index >= prices.index[0]]
+        new = prices[prices.index <= self.prices.index[-1]]
+        dates = old.index.union(new.index)
+        a, b = old.reindex(dates).to_numpy(), new.reindex(dates).to_numpy()
+        same = ((a == b) | (np.isnan(a) & np.isnan(b))).all(axis=1) & dates.isin(old.index) & dates.isin(new.index)
+        return None if same.all() else dates[np.argmin(same)]
+
+    def update(self, prices):
+        """prices가 처음 달라지는 날짜(없으면 마지막 날짜 다음)부터의 행만 가장 긴 윈도우만큼의 앞 구간과 함께
+        다시 계산해 이어 붙입니다. 열이 다르거나 겹치는 구간이 없거나 첫 날짜부터 달라졌으면 전체를 다시 계산합니다.
+        새로 계산한 행 수를 돌려줍니다."""
+        prices = prices.sort_index()
+        with self._lock:
+            if list(prices.columns) != list(self.prices.columns) or prices.empty or prices.index[0] > self.prices.index[-1]:
+                self._rebuild(prices)
+                return len(self.prices)
+            first_changed = self._first_changed(prices)
+            if first_changed is not None and first_changed <= max(self.prices.index[0], prices.index[0]):
+                self._rebuild(prices)
+                return len(self.prices)
+            if first_changed is None:
+                new_prices = prices[prices.index > self.prices.index[-1]]
+                keep = np.ones(len(self.prices), dtype=bool)
+            else:
+                new_prices = prices[prices.index >= first_changed]
+                keep = self.prices.index < first_changed
+            if new_prices.empty:
+                return 0
+            n = len(new_prices)
+            kept_prices = self.prices[keep]
+            context = pd.concat([kept_prices.iloc[-(self._lookback + 1):], new_prices])
+            returns, volatility, mas = self._compute(context)
+            self.prices = pd.concat([kept_prices, new_prices])
+            self.returns = pd.concat([self.returns[keep], returns.iloc[-n:]])
+            self.volatility = pd.concat([self.volatility[keep], volatility.iloc[-n:]])
+            self.moving_averages = {w: pd.concat([self.moving_averages[w][keep], mas[w].iloc[-n:]]) for w in self.ma_windows}
+            self._correlation = None
+            return n
+
+    @property
+    def correlation(self):
+        """최근 corr_window일 수익률 상관계수 행렬 (다음 update 전까지 재사용)"""
+        if self._correlation is None:
+            self._correlation = self.returns.dropna().iloc[-self.corr_window:].corr()
+        return self._correlation
+
+
+MAX_CACHED_ANALYTICS = 32
+_ANALYTICS_CACHE = {}
+_ANALYTICS_LOCK = threading.Lock()
+
+def get_rolling_analytics(key, prices, **windows):
+    """티커 조합(key)별로 분석 객체를 재사용합니다. 같은 key로 다시 부르면 새로 들어온 날짜만 반영합니다."""
+    cache_key = (key, tuple(sorted(windows.items())))
+    with _ANALYTICS_LOCK:
+        analytics = _ANALYTICS_CACHE.get(cache_key)
+        if analytics is None:
+            if len(_ANALYTICS_CACHE) >= MAX_CACHED_ANALYTICS:
+                _ANALYTICS_CACHE.pop(next(iter(_ANALYTICS_CACHE)))
+            analytics = _ANALYTICS_CACHE[cache_key] = RollingFXAnalytics(prices, **windows)
+            return analytics
+    analytics.update(prices)
+    return analytics
@@ -0,0 +1,143 @@
+"""UI 없이 견적 계산과 서류 생성을 일괄 처리하는 CLI
+
+    python -m trade_core quote quotes.jsonl -o results.jsonl
+    python -m trade_core quote quotes.jsonl --monte-carlo --paths 200000
+    python -m trade_core docs shipments.jsonl -o out_dir --workers 8
+
+입력은 한 줄에 JSON 객체 하나인 JSONL 파일입니다. 줄 단위로 읽어 배치마다 프로세스 풀에 나눠 처리하므로
+입력 크기와 관계없이 메모리가 일정하게 유지됩니다. 처리에 실패한 줄은 줄 번호와 함께 오류로 보고하고
+나머지 줄을 계속 처리하며, 실패가 하나라도 있으면 종료 코드 1을 돌려줍니다.
+"""
+import argparse
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+
+from trade_core.fx import DEFAULT_RATES, HISTORY_TICKERS, fetch_currency_history
+from trade_core.pricing import build_line_items, calculate_estimated_cost, to_krw
+from trade_core.risk import DEFAULT_PATHS, calibrate_gbm, landed_cost_risk
+
+BATCH_SIZE = 1000
+DOC_ID_PATTERN = re.compile(r"[\w.-]+")  # 파일명에 쓰는 doc_id는 경로 구분자 없이 이 문자들만 허용
+HISTORY_DAYS = 3 * 365
+
+def _read_jsonl(path):
+    """(줄 번호, 원본 줄)을 돌려줍니다. JSON 파싱은 워커에서 줄마다 따로 합니다."""
+    with open(path, encoding="utf-8") if path != "-" else sys.stdin as f:
+        for lineno, line in enumerate(f, start=1):
+            if line.strip():
+                yield lineno, line
+
+def _run_job(fn, job):
+    """한 줄을 처리해 (줄 번호, 결과, 오류 메시지)를 돌려줍니다. 한 줄의 실패가 배치 전체를 멈추지 않게 합니다."""
+    lineno, line = job
+    try:
+        return lineno, fn(lineno, json.loads(line)), None
+    except Exception as e:
+        return lineno, None, f"{type(e).__name__}: {e}"
+
+def _map_batched(fn, jobs, workers):
+    """jobs를 BATCH_SIZE씩 잘라 워커 프로세스에 나눠 처리합니다 (workers=1이면 현재 프로세스에서 처리)."""
+    jobs = iter(jobs)
+    run = partial(_run_job, fn)
+    if workers == 1:
+        yield from map(run, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while batch := list(islice(jobs, BATCH_SIZE)):
+            yield from pool.map(run, batch, chunksize=max(1, len(batch) // (workers * 4)))
+
+@lru_cache(maxsize=256)
+def _fx_calibration(currency, rate, use_realtime, current_date):
+    """통화/환율별 이력 조회와 GBM 보정은 워커 프로세스마다 한 번만 합니다."""
+    ticker, multiplier = HISTORY_TICKERS[currency]
+    history = fetch_currency_history(ticker, rate, multiplier, use_realtime, current_date, HISTORY_DAYS)
+    return calibrate_gbm(history['환율'])
+
+def quote_record(record, monte_carlo=False, n_paths=DEFAULT_PATHS, use_realtime=False, historical_drift=False):
+    """견적 한 건: items(품명/수량/단가) 또는 base_price로 예상 총액과 원화 환산액을 계산합니다.
+    monte_carlo가 켜져 있으면 결제 조건의 결제일까지 환율 변동을 반영한 원화 비용 분포(risk)도 붙입니다."""
+    currency = record.get("currency", "USD")
+    if currency not in DEFAULT_RATES:
+        raise ValueError(f"지원하지 않는 통화: {currency}")
+    if "items" in record:
+        base_price = sum(it["amount"] for it in build_line_items(record["items"]))
+    else:
+        base_price = float(record["base_price"])
+    estimated_total = calculate_estimated_cost(base_price, record.get("terms", "FOB"), record.get("transport", "해상(SEA)"),
+                                               record.get("insurance", "선택 안함"), record.get("pay", "사전 송금"), record.get("fta", "협정 미적용 (기본세율)"))
+    rate = float(record.get("rate", DEFAULT_RATES[currency]))
+    result = {**{k: v for k, v in record.items() if k != "items"}, "subtotal": base_price, "estimated_total": estimated_total, "total_krw": to_krw(estimated_total, currency, rate)}
+    if monte_carlo:
+        calibration = _fx_calibration(currency, rate, use_realtime, date.today())
+        result["risk"] = landed_cost_risk(estimated_total, currency, rate, None, record.get("pay", "사전 송금"), n_paths=n_paths,
+                                          calibration=calibration, historical_drift=historical_drift)
+    return result
+
+def _quote_line(lineno, record, **options):
+    return quote_record(record, **options)
+
+def _write_documents(lineno, record, out_dir):
+    from trade_core.documents import build_document_files
+    doc_id = str(record.get("doc_id", f"{lineno:06d}"))
+    if not DOC_ID_PATTERN.fullmatch(doc_id):
+        raise ValueError(f"doc_id에는 문자, 숫자, '.', '_', '-'만 쓸 수 있습니다: {doc_id!r}")
+    if "items" in record:
+        record = {**record, "items": build_line_items(record["items"], marks=record.get("marks", ""))}
+    paths = []
+    for name, payload in build_document_files(record).items():
+        path = Path(out_dir) / f"{doc_id}_{name}"
+        path.write_bytes(payload)
+        paths.append(str(path))
+    return paths
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m trade_core", description="Trade Master 일괄 처리 (Streamlit 없이 실행)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    quote = sub.add_parser("quote", help="JSONL 견적 파일의 예상 총액/원화 환산액 계산")
+    quote.add_argument("input", help="입력 JSONL 경로 ('-'이면 표준 입력)")
+    quote.add_argument("-o", "--output", default="-", help="출력 JSONL 경로 (기본: 표준 출력)")
+    quote.add_argument("--workers", type=int, default=1, help="워커 프로세스 수")
+    quote.add_argument("--monte-carlo", action="store_true", help="결제일 환율 변동에 따른 원화 비용 분포(P5/P50/P95, VaR) 추가")
+    quote.add_argument("--paths", type=int, default=DEFAULT_PATHS, help="Monte Carlo 경로 수")
+    quote.add_argument("--historical-drift", action="store_true", help="Monte Carlo에 환율 이력의 평균 수익률(drift) 반영 (기본: drift 0)")
+    quote.add_argument("--realtime", action="store_true", help="환율 이력을 yfinance에서 조회 (기본: 시뮬레이션 이력)")
+
+    docs = sub.add_parser("docs", help="JSONL 거래 데이터로 CI/PL/BL docx 생성")
+    docs.add_argument("input", help="입력 JSONL 경로 ('-'이면 표준 입력)")
+    docs.add_argument("-o", "--output", required=True, help="docx를 저장할 디렉터리")
+    docs.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본: CPU 코어 수)")
+
+    args = parser.parse_args(argv)
+    failures = 0
+    if args.command == "quote":
+        out = open(args.output, "w", encoding="utf-8") if args.output != "-" else sys.stdout
+        try:
+            fn = partial(_quote_line, monte_carlo=args.monte_carlo, n_paths=args.paths, use_realtime=args.realtime,
+                         historical_drift=args.historical_drift)
+            for lineno, result, error in _map_batched(fn, _read_jsonl(args.input), args.workers):
+                if error:
+                    failures += 1
+                    print(f"line {lineno}: {error}", file=sys.stderr)
+                    result = {"line": lineno, "error": error}
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        finally:
+            if out is not sys.stdout: out.close()
+    elif args.command == "docs":
+        Path(args.output).mkdir(parents=True, exist_ok=True)
+        count = 0
+        for lineno, _, error in _map_batched(partial(_write_documents, out_dir=args.output), _read_jsonl(args.input), args.workers):
+            if error:
+                failures += 1
+                print(f"line {lineno}: {error}", file=sys.stderr)
+            else:
+                count += 1
+        print(f"{count}건 x 3개 서류 생성 완료: {args.output}" + (f" (실패 {failures}건)" if failures else ""), file=sys.stderr)
+    return 1 if failures else 0
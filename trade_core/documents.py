@@ -0,0 +1,95 @@
+"""무역 서류(CI, PL, B/L) docx 생성"""
+from io import BytesIO
+from itertools import chain, islice
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from trade_core.pricing import build_line_items  # noqa: F401  (서류 생성 쪽 기존 import 경로 유지)
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+ROW_CHUNK = 500  # 품목 행을 한 번에 파싱하는 단위 (대량 품목에서도 중간 XML 문자열 크기를 제한)
+
+def _fmt(val, spec):
+    return format(val, spec) if isinstance(val, (int, float)) else str(val)
+
+def _fmt_qty(val):
+    """수량은 정수면 정수로, 소수가 있으면 소수 둘째 자리까지 표시합니다."""
+    return _fmt(val, ',.0f' if not isinstance(val, (int, float)) or float(val).is_integer() else ',.2f')
+
+def _cell_xml(text, tc_pr):
+    runs = '<w:r><w:br/></w:r>'.join(f'<w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r>' for line in str(text).split('\n'))
+    return f'<w:tc>{tc_pr}<w:p>{runs}</w:p></w:tc>'
+
+def _append_rows_bulk(table, rows):
+    """셀 단위 python-docx 접근 대신 행 XML을 묶어서 한 번에 파싱해 표에 붙입니다."""
+    tbl = table._tbl
+    tc_prs = [f'<w:tcPr><w:tcW w:type="{tc.tcPr.tcW.type}" w:w="{tc.tcPr.tcW.get(qn("w:w"))}"/></w:tcPr>' if tc.tcPr is not None and tc.tcPr.tcW is not None else '' for tc in tbl.tr_lst[0].tc_lst]
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, ROW_CHUNK))
+        if not chunk: break
+        body = ''.join('<w:tr>' + ''.join(_cell_xml(v, tc_prs[i]) for i, v in enumerate(r)) + '</w:tr>' for r in chunk)
+        tbl.extend(parse_xml(f'<w:tbl {nsdecls("w")}>{body}</w:tbl>'))
+
+def _add_item_table(doc, headers, rows):
+    table = doc.add_table(rows=1, cols=len(headers)); table.style = 'Table Grid'
+    for i, txt in enumerate(headers): table.rows[0].cells[i].text = txt
+    _append_rows_bulk(table, rows)
+    return table
+
+def _line_items(data):
+    if 'items' in data: return data['items']
+    return [{key: data[key] for key in ['marks', 'pkg_kind', 'description', 'qty', 'unit_price', 'amount', 'net_weight', 'gross_weight', 'measure'] if key in data}]
+
+def create_ci_docx(data):
+    doc = Document(); doc.add_heading('COMMERCIAL INVOICE', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    table = doc.add_table(rows=6, cols=2); table.style = 'Table Grid'
+    fields = [(f"① Shipper/Seller:\n{data['shipper']}", f"⑦ Invoice No. and date:\n{data['inv_no_date']}"),
+              (f"② Consignee:\n{data['consignee']}", f"⑧ L/C No. and date:\n{data['lc_no_date']}"),
+              (f"⑨ Buyer:\n{data['buyer']}", f"⑪ Terms: {data['terms']} / {data['transport']}"),
+              (f"③ Departure date: {data['dep_date']}", f"⑫ Insurance: {data['insurance']}"),
+              (f"④ Vessel: {data['vessel']} / From: {data['from_port']}", f"⑥ To: {data['to_port']}"),
+              (f"⑬ FTA Agreement: {data['fta']}", f"⑭ Payment: {data['pay']}")]
+    for i, (left, right) in enumerate(fields):
+        table.rows[i].cells[0].text = left; table.rows[i].cells[1].text = right
+    items = _line_items(data)
+    currency = data.get('currency', "")
+    total_qty = sum(it['qty'] for it in items if isinstance(it.get('qty'), (int, float)))
+    total_amount = sum(it['amount'] for it in items if isinstance(it.get('amount'), (int, float)))
+    rows = ((it.get('marks', ""), it.get('pkg_kind', ""), it.get('description', ""), _fmt_qty(it.get('qty', "")), _fmt(it.get('unit_price', ""), ',.2f'), _fmt(it.get('amount', ""), ',.2f')) for it in items)
+    if 'items' in data:
+        rows = chain(rows, [("", data.get('pkg_kind', ""), "TOTAL", _fmt_qty(total_qty), "", f"{total_amount:,.2f} ({currency})"),
+                            ("", "", f"Estimated total ({data['terms']})", "", "", str(data.get('amount', "")))])
+    _add_item_table(doc, ['Marks', 'Pkgs', 'Description', 'Qty', 'Price', 'Amount'], rows)
+    return doc
+
+def create_pl_docx(data):
+    doc = Document(); doc.add_heading('PACKING LIST', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    table = doc.add_table(rows=4, cols=2); table.style = 'Table Grid'
+    table.rows[0].cells[0].text = f"Seller: {data['shipper']}"; table.rows[0].cells[1].text = f"Inv No: {data['inv_no_date']}"
+    table.rows[1].cells[0].text = f"Consignee: {data['consignee']}"; table.rows[1].cells[1].text = f"Buyer: {data['buyer']}"
+    keys = ['marks', 'pkg_kind', 'description', 'net_weight', 'gross_weight', 'measure']
+    rows = (tuple(str(it.get(key, "")) for key in keys) for it in _line_items(data))
+    if 'items' in data:
+        rows = chain(rows, [("", data.get('pkg_kind', ""), "TOTAL", data.get('net_weight', ""), data.get('gross_weight', ""), data.get('measure', ""))])
+    _add_item_table(doc, ['Marks', 'Pkgs', 'Goods', 'N.W', 'G.W', 'Meas'], rows)
+    return doc
+
+def create_bl_docx(data):
+    doc = Document(); doc.add_heading('BILL OF LADING', 0).alignment = WD_ALIGN_PARAGRAPH.CENTER
+    table = doc.add_table(rows=3, cols=2); table.style = 'Table Grid'
+    table.rows[0].cells[0].text = f"Shipper: {data['shipper']}"; table.rows[0].cells[1].text = f"B/L No: {data['bl_no']}"
+    table.rows[1].cells[0].text = f"Consignee: {data['consignee']}"; table.rows[1].cells[1].text = f"Vessel: {data['vessel']}"
+    table.rows[2].cells[0].text = f"Loading: {data['from_port']}"; table.rows[2].cells[1].text = f"Discharge: {data['to_port']}"
+    return doc
+
+def build_document_files(data):
+    """세 가지 서류를 생성해 {파일명: docx 바이트}로 돌려줍니다."""
+    doc_files = {}
+    for name, builder in [("Commercial_Invoice.docx", create_ci_docx), ("Packing_List.docx", create_pl_docx), ("Bill_of_Lading.docx", create_bl_docx)]:
+        bio = BytesIO(); builder(data).save(bio); doc_files[name] = bio.getvalue()
+    return doc_files
@@ -0,0 +1,63 @@
+"""환율 조회 및 환율 이력 데이터
+
+pandas는 이력을 만들 때만 불러옵니다. 견적만 계산하는 CLI 워커가 환율 상수를 가져올 때 pandas import 비용을 내지 않게 합니다.
+"""
+import zlib
+from datetime import date
+
+import numpy as np
+
+DEFAULT_RATES = {"USD": 1440.70, "JPY": 935.94, "EUR": 1717.31, "CNY": 207.38}
+REALTIME_TICKERS = {"USD": "USDKRW=X", "JPY": "JPYKRW=X", "EUR": "EURKRW=X", "CNY": "CNYKRW=X"}
+HISTORY_TICKERS = {"USD": ("KRW=X", 1), "JPY": ("JPYKRW=X", 100), "EUR": ("EURKRW=X", 1), "CNY": ("CNYKRW=X", 1)}  # (티커, 환율 배수)
+
+def fetch_realtime_rates(fallback_rates):
+    """yfinance를 사용하여 실시간 환율 정보를 가져옵니다. 데이터가 없는 통화는 fallback_rates 값을 씁니다."""
+    import yfinance as yf
+    updated_rates = {}
+    for code, ticker in REALTIME_TICKERS.items():
+        data = yf.download(ticker, period="2d", interval="1d", progress=False)
+        if not data.empty:
+            val = data['Close'].iloc[-1]
+            updated_rates[code] = float(val) * 100 if code == "JPY" else float(val)
+        else:
+            updated_rates[code] = fallback_rates[code]
+    return updated_rates
+
+def fetch_currency_history(ticker_symbol, base_val, multiplier, use_realtime, current_date, days=30):
+    """최근 days일 환율 이력. 실시간 조회가 꺼져 있거나 실패하면 시뮬레이션 데이터를 돌려줍니다."""
+    import pandas as pd
+    if use_realtime:
+        try:
+            import yfinance as yf
+            start = pd.Timestamp(current_date) - pd.Timedelta(days=days)
+            data = yf.download(ticker_symbol, start=start, end=pd.Timestamp(current_date) + pd.Timedelta(days=1), interval="1d", progress=False)
+            if not data.empty and not data['Close'].isnull().all():
+                df = data[['Close']].reset_index()
+                df.columns = ["날짜", "환율"]
+                df['환율'] = df['환율'] * multiplier
+                df['날짜'] = pd.to_datetime(df['날짜']).dt.date
+                return df.sort_values(by="날짜")
+        except Exception: pass
+
+    return _simulated_history(ticker_symbol, base_val, current_date, days)
+
+SIM_EPOCH = date(2000, 1, 1)  # 시뮬레이션 일간 충격을 날짜별로 고정하는 기준일
+SIM_MEMORY_DAYS = 20  # 최근 며칠의 충격 합으로 수준을 정해, 기간이 길어도 기준 환율 근처에 머물게 함
+SIM_ANCHOR_DAYS = 10  # 마지막 며칠에 걸쳐 기준 환율로 끝나도록 보정
+
+def _simulated_history(ticker_symbol, base_val, current_date, days):
+    """날짜별로 고정된 충격(티커 시드)으로 만든 이력. 하루가 추가되어도 마지막 SIM_ANCHOR_DAYS일 전의 값은
+    바뀌지 않고, 마지막 값은 항상 base_val(현재 환율)입니다."""
+    import pandas as pd
+    dates = pd.date_range(end=current_date, periods=days)
+    origin = min(pd.Timestamp(SIM_EPOCH), dates[0] - pd.Timedelta(days=SIM_MEMORY_DAYS))
+    # 프로세스마다 달라지는 hash() 대신 고정 다이제스트로 시드를 정해, 워커/재실행 간 같은 이력을 만듦
+    rng = np.random.default_rng(zlib.crc32(ticker_symbol.encode()))
+    shocks = np.cumsum(rng.standard_normal((dates[-1] - origin).days + 1) * 0.005)
+    level = shocks[SIM_MEMORY_DAYS:] - shocks[:-SIM_MEMORY_DAYS]
+    level = level[-days:]
+    anchor = min(SIM_ANCHOR_DAYS, days - 1)
+    ramp = np.clip((np.arange(days) - (days - 1 - anchor)) / max(anchor, 1), 0, 1)
+    values = base_val * np.exp(level - level[-1] * ramp)
+    return pd.DataFrame({"날짜": dates.date, "환율": values})
@@ -0,0 +1,31 @@
+"""인코텀즈/보험/결제/FTA 조건별 예상 비용 계산"""
+
+FREIGHT_TERMS = ["CFR", "CIF", "CPT", "CIP", "DAP", "DPU", "DDP"]
+INSURANCE_RATES = {"ICC(A) (=ICC(AIR))": 0.008, "ICC(B)": 0.005, "ICC(C)": 0.003, "선택 안함": 0}
+PAYMENT_FEES = {"사전 송금": 0.0, "Sight L/C": 0.008, "D/P": 0.0015, "D/A": 0.0025}
+FTA_RATES = {"협정 미적용 (기본세율)": 0.18, "한-미 FTA (KOR-USA)": 0.10, "한-EU FTA (KOR-EU)": 0.10, "한-중 FTA (KOR-CHINA)": 0.14, "RCEP": 0.12}
+
+def calculate_estimated_cost(base_price, term, transport, insurance, payment, fta_type):
+    total = base_price
+    if term in FREIGHT_TERMS:
+        freight_rate = 0.15 if transport == "항공(AIR)" else 0.05
+        total += base_price * freight_rate
+    total += base_price * INSURANCE_RATES.get(insurance, 0)
+    fee_key = next((k for k in PAYMENT_FEES if k in payment), "사전 송금")
+    total += base_price * PAYMENT_FEES.get(fee_key, 0)
+    if term == "DDP": total += base_price * FTA_RATES.get(fta_type, 0.18)
+    return total
+
+def to_krw(amount, currency, rate):
+    """외화 금액을 원화로 환산합니다. JPY 환율은 100엔 기준입니다."""
+    return amount * (rate / 100) if currency == "JPY" else amount * rate
+
+def build_line_items(rows, marks="", pkg_kind=""):
+    """품목 행(품명/수량/단가)에서 라인별 금액을 계산한 품목 목록을 만듭니다."""
+    items = []
+    for r in rows:
+        qty = float(r.get('qty') or 0); unit_price = float(r.get('unit_price') or 0)
+        items.append({"marks": r.get('marks') or marks, "pkg_kind": r.get('pkg_kind') or pkg_kind, "description": r.get('description') or "",
+                      "qty": qty, "unit_price": unit_price, "amount": qty * unit_price,
+                      "net_weight": r.get('net_weight', ""), "gross_weight": r.get('gross_weight', ""), "measure": r.get('measure', "")})
+    return items
@@ -0,0 +1,51 @@
+"""결제 시점 환율 변동을 반영한 Monte Carlo 원화 비용 분포
+
+D/A, D/P처럼 대금 결제가 몇 주 뒤에 일어나는 조건은 현재 환율 하나로 원화 비용을 확정할 수 없으므로,
+환율 이력으로 보정한 기하 브라운 운동(GBM) 경로를 (경로 수 x 결제일수) 배열 하나로 한 번에 생성해
+결제일 환율의 원화 비용 분포를 구합니다. 과거 수익률 평균은 표준오차가 커서 분포를 우연히 한쪽으로
+밀기 때문에 기본값은 drift 0(현재 환율이 결제일 환율의 기댓값)이고, 변동성만 이력으로 보정합니다.
+"""
+import numpy as np
+
+from trade_core.pricing import to_krw
+
+# 결제 조건별 선적 후 대금 결제까지의 예상 일수
+SETTLEMENT_DAYS = {"사전 송금": 0, "Sight L/C": 7, "D/P": 30, "D/A": 60}
+DEFAULT_PATHS = 100_000
+
+def settlement_days(payment):
+    return SETTLEMENT_DAYS[next((k for k in SETTLEMENT_DAYS if k in payment), "사전 송금")]
+
+def calibrate_gbm(rates):
+    """일간 로그수익률의 평균(drift)과 표준편차(volatility)를 추정합니다.
+    로그수익률 평균은 이미 -sigma^2/2 보정이 반영된 값이므로 경로 생성에 그대로 씁니다."""
+    log_returns = np.diff(np.log(np.asarray(rates, dtype=np.float64)))
+    return float(log_returns.mean()), float(log_returns.std(ddof=1))
+
+def simulate_fx_paths(spot, mu, sigma, horizon_days, n_paths=DEFAULT_PATHS, seed=None):
+    """(n_paths, horizon_days) 환율 경로 배열. 메모리를 줄이려고 float32로 계산합니다."""
+    rng = np.random.default_rng(seed)
+    paths = rng.standard_normal((n_paths, horizon_days), dtype=np.float32)
+    paths *= np.float32(sigma)
+    paths += np.float32(mu)
+    np.cumsum(paths, axis=1, out=paths)
+    np.exp(paths, out=paths)
+    paths *= np.float32(spot)
+    return paths
+
+def landed_cost_risk(amount, currency, spot_rate, history_rates, payment, n_paths=DEFAULT_PATHS, horizon_days=None, seed=0, calibration=None, historical_drift=False):
+    """결제일 원화 비용 분포 요약 (P5/P50/P95, 95% VaR = P95 - 현재 환율 기준 비용)
+    calibration에 미리 구한 (drift, volatility)를 넘기면 history_rates로 다시 보정하지 않습니다.
+    historical_drift가 켜져 있을 때만 이력의 로그수익률 평균을 drift로 씁니다."""
+    horizon = settlement_days(payment) if horizon_days is None else horizon_days
+    spot_krw = to_krw(amount, currency, spot_rate)
+    if horizon == 0:
+        return {"horizon_days": 0, "n_paths": 0, "spot_krw": spot_krw, "mean": spot_krw, "p5": spot_krw, "p50": spot_krw, "p95": spot_krw, "var95": 0.0}
+    mu, sigma = calibration if calibration is not None else calibrate_gbm(history_rates)
+    if not historical_drift:
+        mu = 0.0
+    settlement_rates = simulate_fx_paths(spot_rate, mu, sigma, horizon, n_paths, seed)[:, -1]
+    costs = to_krw(amount, currency, settlement_rates.astype(np.float64))
+    p5, p50, p95 = np.percentile(costs, [5, 50, 95])
+    return {"horizon_days": horizon, "n_paths": n_paths, "spot_krw": spot_krw, "mean": float(costs.mean()),
+            "p5": float(p5), "p50": float(p50), "p95": float(p95), "var95": float(p95 - spot_krw)}